@@ -395,6 +395,105 @@ test.describe('API Endpoints', () => {
 		});
 	});
 
+	test.describe('Letta Integration API (/api/letta)', () => {
+		test('should return a combined curation snapshot', async ({ request }) => {
+			const response = await request.get(`${BASE_URL}/api/letta?action=snapshot`);
+
+			expect(response.ok()).toBeTruthy();
+			const body = await response.json();
+			expect(Array.isArray(body.topics)).toBeTruthy();
+			expect(Array.isArray(body.notebooks)).toBeTruthy();
+			expect(body).toHaveProperty('extensions');
+			expect(body.progress).toHaveProperty('topics');
+		});
+
+		test('should keep the curation snapshot bounded', async ({ request }) => {
+			const response = await request.get(`${BASE_URL}/api/letta?action=snapshot`);
+
+			expect(response.ok()).toBeTruthy();
+			const body = await response.json();
+			for (const notebook of body.notebooks) {
+				expect(notebook.messages.length).toBeLessThanOrEqual(6);
+				expect(notebook.messages.length + notebook.omittedMessages).toBe(notebook.messageCount);
+			}
+			// Code bodies stay behind fetch_context_bundle
+			for (const extension of Object.values(body.extensions) as Array<{ codeExamples: object[] }>) {
+				for (const example of extension.codeExamples) {
+					expect(example).not.toHaveProperty('code');
+				}
+			}
+		});
+
+		test('should return 304 for unchanged extensions with matching ETag', async ({ request }) => {
+			const first = await request.get(`${BASE_URL}/api/letta?action=extensions`);
+			expect(first.ok()).toBeTruthy();
+			const etag = first.headers()['etag'];
+			expect(etag).toBeTruthy();
+
+			const second = await request.get(`${BASE_URL}/api/letta?action=extensions`, {
+				headers: { 'If-None-Match': etag }
+			});
+			expect(second.status()).toBe(304);
+		});
+
+		test('should match a weak ETag from a compressed extensions response', async ({ request }) => {
+			const first = await request.get(`${BASE_URL}/api/letta?action=extensions`);
+			const etag = first.headers()['etag'].replace(/^W\//, '');
+
+			const second = await request.get(`${BASE_URL}/api/letta?action=extensions`, {
+				headers: { 'If-None-Match': `W/${etag}` }
+			});
+			expect(second.status()).toBe(304);
+			expect(second.headers()['etag']).toBe(`W/${etag}`);
+		});
+
+		test('should return topics in columnar form when requested', async ({ request }) => {
+			const response = await request.get(`${BASE_URL}/api/letta?action=topics&format=columnar`);
+
+			expect(response.ok()).toBeTruthy();
+			const body = await response.json();
+			expect(body.topics.columns).toContain('id');
+			expect(body.topics.rows.length).toBeGreaterThan(1);
+			expect(body.topics.rows[0]).toHaveLength(body.topics.columns.length);
+		});
+
+		test('should reject bulk resource add without items', async ({ request }) => {
+			const response = await request.post(`${BASE_URL}/api/letta`, {
+				data: { action: 'add_resources_bulk', items: [] }
+			});
+
+			expect(response.status()).toBe(400);
+		});
+
+		test('should report invalid items in bulk code example add', async ({ request }) => {
+			const response = await request.post(`${BASE_URL}/api/letta`, {
+				data: {
+					action: 'add_code_examples_bulk',
+					items: [{ topicId: 'nonexistent-topic', title: 'x', language: 'gdscript', code: 'pass', explanation: 'x' }]
+				}
+			});
+
+			expect(response.status()).toBe(400);
+			const body = await response.json();
+			expect(body.added).toBe(0);
+			expect(body.errors).toHaveLength(1);
+		});
+
+		test('should reject bulk resources with an unknown type', async ({ request }) => {
+			const response = await request.post(`${BASE_URL}/api/letta`, {
+				data: {
+					action: 'add_resources_bulk',
+					items: [{ topicId: 'game-loop', title: 'x', url: 'https://example.com', type: 'podcast' }]
+				}
+			});
+
+			expect(response.status()).toBe(400);
+			const body = await response.json();
+			expect(body.added).toBe(0);
+			expect(body.errors[0].error).toContain('type must be one of');
+		});
+	});
+
 	test.describe('Activity API (/api/letta/activity)', () => {
 		test('should get agent activity log', async ({ request }) => {
 			const response = await request.get(`${BASE_URL}/api/letta/activity`);
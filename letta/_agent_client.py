@@ -0,0 +1,168 @@
+"""
+Shared Letta client and messaging helpers for the Godot Learning App scripts.
+
+Clients are created lazily and memoized, so every script that imports this
+module shares one connection per Letta server.
+"""
+
+import os
+import re
+import sys
+import time
+import textwrap
+import itertools
+from collections import deque
+from functools import lru_cache
+from letta_client import Letta, NotFoundError, RateLimitError
+
+LETTA_BASE_URL = os.getenv("LETTA_BASE_URL", "http://localhost:8283")
+
+# Optional comma-separated pool of Letta servers backed by the same database,
+# so every agent exists on each. Messages are spread round-robin across them;
+# a server that answers 429 sits out for RATE_LIMIT_COOLDOWN_S seconds.
+LETTA_BASE_URLS = [
+    url.strip() for url in os.getenv("LETTA_BASE_URLS", LETTA_BASE_URL).split(",") if url.strip()
+]
+RATE_LIMIT_COOLDOWN_S = 60
+
+_round_robin = itertools.cycle(LETTA_BASE_URLS)
+_cooldown_until: dict[str, float] = {}
+
+
+@lru_cache(maxsize=None)
+def _client_for(base_url: str) -> Letta:
+    return Letta(base_url=base_url)
+
+
+def get_client() -> Letta:
+    """Return the shared Letta client for the primary local server (no api_key needed)."""
+    return _client_for(LETTA_BASE_URL)
+
+
+def write_atomic(path: str, data: bytes) -> None:
+    """Write a file via temp file + rename so a crash never leaves it half-written."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def with_pooled_client(call):
+    """
+    Run call(client) on the next pooled server that isn't cooling down.
+    On a 429 the server is evicted for a while and the call moves to the next one.
+    """
+    last_error = None
+    for _ in range(len(LETTA_BASE_URLS)):
+        base_url = next(_round_robin)
+        if _cooldown_until.get(base_url, 0) > time.monotonic():
+            continue
+        try:
+            return call(_client_for(base_url))
+        except RateLimitError as e:
+            _cooldown_until[base_url] = time.monotonic() + RATE_LIMIT_COOLDOWN_S
+            last_error = e
+    if last_error:
+        raise last_error
+    # Every server is cooling down - fall back to the primary and let it queue
+    return call(get_client())
+
+
+def compact_prompt(text: str) -> str:
+    """
+    Dedent a triple-quoted prompt and squeeze out whitespace that only costs tokens:
+    trailing spaces and repeated inner spaces. Leading indentation is kept since
+    it carries list nesting.
+    """
+    text = textwrap.dedent(text).strip()
+    return "\n".join(re.sub(r"(?<=\S)[ \t]+", " ", line.rstrip()) for line in text.split("\n"))
+
+
+# Sliding window of recent turns mirrored into the agent's working_memory block
+WORKING_MEMORY_TURNS = 6
+WORKING_MEMORY_LIMIT = 1500
+
+
+def send_message(agent_id: str, content: str, agent_name: str = "Agent") -> str:
+    """Send a message, print the response, and return the agent's reply text."""
+    response = with_pooled_client(lambda client: client.agents.messages.create(
+        agent_id=agent_id,
+        messages=[{"role": "user", "content": content}]
+    ))
+
+    replies = []
+    for message in response.messages:
+        if hasattr(message, 'reasoning') and message.reasoning:
+            reasoning = message.reasoning
+            print(f"\n[Thinking]: {reasoning[:300] + '...' if len(reasoning) > 300 else reasoning}")
+        if hasattr(message, 'content') and message.content:
+            print(f"\n[{agent_name}]: {message.content}")
+            replies.append(str(message.content))
+        if hasattr(message, 'tool_calls') and message.tool_calls:
+            for tc in message.tool_calls:
+                print(f"\n[Tool: {tc.function.name}]")
+                if hasattr(tc.function, 'arguments'):
+                    args = tc.function.arguments
+                    text = args if isinstance(args, str) else str(args)
+                    print(f"  Args: {text[:150]}{'...' if len(text) > 150 else ''}")
+
+    return "\n".join(replies)
+
+
+def stream_message(agent_id: str, content: str, agent_name: str = "Agent") -> str:
+    """
+    Send a message and print the response token-by-token as it arrives.
+    Used for interactive chat; returns the agent's reply text.
+    """
+    stream = with_pooled_client(lambda client: client.agents.messages.stream(
+        agent_id=agent_id,
+        messages=[{"role": "user", "content": content}],
+        stream_tokens=True
+    ))
+
+    replies = []
+    current = None  # (message_type, id) of the message being printed
+    for chunk in stream:
+        message_type = getattr(chunk, 'message_type', None)
+        key = (message_type, getattr(chunk, 'id', None))
+        is_new = key != current
+
+        if message_type == 'reasoning_message':
+            if is_new:
+                sys.stdout.write("\n[Thinking]: ")
+            sys.stdout.write(chunk.reasoning or "")
+        elif message_type == 'assistant_message':
+            text = chunk.content if isinstance(chunk.content, str) else \
+                "".join(getattr(part, 'text', '') for part in chunk.content)
+            if is_new:
+                sys.stdout.write(f"\n\n[{agent_name}]: ")
+                if replies:
+                    replies.append("\n")
+            sys.stdout.write(text)
+            replies.append(text)
+        elif message_type == 'tool_call_message':
+            name = getattr(chunk.tool_call, 'name', None)
+            if is_new and name:
+                sys.stdout.write(f"\n\n[Tool: {name}]")
+        else:
+            continue
+
+        current = key
+        sys.stdout.flush()
+
+    print()
+    return "".join(replies)
+
+
+def update_working_memory(agent_id: str, turns: deque) -> bool:
+    """
+    Overwrite the agent's working_memory block with the most recent turns.
+    Returns False if the agent has no working_memory block (older setups).
+    Other API errors are raised, so a transient failure doesn't disable the window.
+    """
+    value = "\n\n".join(turns)[-WORKING_MEMORY_LIMIT:]
+    try:
+        get_client().agents.blocks.update("working_memory", agent_id=agent_id, value=value)
+        return True
+    except NotFoundError:
+        return False
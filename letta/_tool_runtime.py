@@ -0,0 +1,178 @@
+"""
+Runtime shared by the Letta tools in tools.py and setup_agent.py.
+
+Letta runs an uploaded tool from its own source alone, so the uploaders prepend
+this whole file to every tool (see tools.tool_source). In-process callers import
+the same names, so both paths use one copy of this code.
+
+Letta picks the tool out of its source as the last function definition in
+ast.walk order, which visits every top-level statement before any nested one.
+Keep this file to top-level functions with no nested defs or classes with
+methods, so the tool appended after it is always the function Letta finds.
+"""
+
+import os
+import glob
+import json
+import time
+import hashlib
+import tempfile
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+# Shared keep-alive session. In-process it pools connections across tool calls;
+# Letta re-executes the uploaded source on every call, so there it only spans
+# the requests of one call (fetch_context_bundle's fan-out)
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    # Retry transient gateway errors; the final 5xx is returned so tools can report it.
+    # urllib3 leaves POSTs out of status/read retries (add_* calls are not idempotent)
+    # but still retries failed connects, which never reached the server
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+# requests' default encoding list adds br when the optional brotli package is
+# installed - on the Letta host too, for uploaded copies
+SESSION.headers.update({
+    "User-Agent": "godot-learning-letta-tools",
+    "Connection": "keep-alive",
+    "Accept-Encoding": DEFAULT_ACCEPT_ENCODING
+})
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_bytes = orjson.dumps
+except ImportError:  # orjson is optional on the Letta host
+    json_loads = json.loads
+    json_bytes = lambda obj: json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+class ToolError(Exception):
+    """A failure a tool reports to the model as error JSON. Args: (message, status=None)."""
+
+
+def json_text(obj) -> str:
+    """Serialize obj as compact JSON text, the form tools hand back to the model."""
+    return json_bytes(obj).decode("utf-8")
+
+
+def tool_error(message: str, status: int = None) -> str:
+    """
+    Format a failure the way every tool reports it, so the model sees one schema:
+    {"error": {"message": ..., "status": <HTTP status, when there is one>}}.
+    """
+    error = {"message": message} if status is None else {"message": message, "status": status}
+    return json_text({"error": error})
+
+
+def app_request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a request to the learning app through SESSION (default timeout 3s
+    connect / 10s read). Raises ToolError when the app can't be reached or
+    answers with an error status once the session's retries are used up.
+    """
+    kwargs.setdefault("timeout", (3, 10))
+    try:
+        response = SESSION.request(method, url, **kwargs)
+    except requests.RequestException as e:
+        raise ToolError(f"Cannot reach the learning app: {e}") from e
+    if not response.ok:
+        raise ToolError(f"Learning app returned {response.status_code}: {response.text[:500]}", response.status_code)
+    return response
+
+
+def app_get(url: str, **kwargs) -> str:
+    """GET url and return the response body as text."""
+    return app_request("GET", url, **kwargs).content.decode("utf-8")
+
+
+def app_post(url: str, payload, **kwargs) -> str:
+    """POST payload as JSON, serialized up front with orjson when available, and return the body."""
+    headers = {"Content-Type": "application/json"}
+    return app_request("POST", url, data=json_bytes(payload), headers=headers, **kwargs).content.decode("utf-8")
+
+
+# Read-only responses are cached on disk, since Letta re-executes the uploaded
+# source on every call and nothing in memory survives between calls.
+# Seconds each kind of cached_get entry stays fresh:
+CACHE_TTL_S = {
+    "topics": 300,     # the curriculum rarely changes
+    "notebooks": 15,   # agents list notebooks more than once while planning a turn
+    "notebook": 15,
+    "lessons": 30,     # add_lesson clears these, so new lessons show up at once
+    "progress": 5,     # read several times per turn; edits still show up almost immediately
+}
+CACHE_DIR = "~/.cache/letta_agent_ttl"
+# ETag and last body per URL for etag_get
+ETAG_CACHE_FILE = "~/.cache/letta_agent_etags.json"
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Best-effort write via temp file + rename, since parallel tool calls can write at once."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def cached_get(kind: str, url: str) -> str:
+    """
+    app_get(url), served from the disk cache while the (kind, url) entry is
+    younger than CACHE_TTL_S[kind]. Only successful responses are cached.
+    """
+    path = os.path.join(os.path.expanduser(CACHE_DIR), f"{kind}-{hashlib.sha1(url.encode()).hexdigest()[:16]}.json")
+    try:
+        if time.time() - os.path.getmtime(path) < CACHE_TTL_S[kind]:
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+    except OSError:
+        pass
+    body = app_get(url)
+    _write_atomic(path, body.encode("utf-8"))
+    return body
+
+
+def clear_cache(kind: str) -> None:
+    """Drop every cached entry of one kind, after a write that changes it."""
+    for path in glob.glob(os.path.join(os.path.expanduser(CACHE_DIR), f"{kind}-*.json")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def etag_get(url: str) -> str:
+    """
+    Conditional GET for payloads that change rarely but unpredictably: the ETag
+    and last body persist in ETAG_CACHE_FILE, so an unchanged payload comes back
+    as an empty 304. A missing or corrupt cache file just means a full fetch.
+    """
+    path = os.path.expanduser(ETAG_CACHE_FILE)
+    try:
+        with open(path, "rb") as f:
+            etags = json_loads(f.read())
+    except (OSError, ValueError):
+        etags = {}
+    if not isinstance(etags, dict):
+        etags = {}
+    entry = etags.get(url)
+    etag, cached_body = entry if isinstance(entry, list) and len(entry) == 2 else ("", "")
+
+    response = app_request("GET", url, headers={"If-None-Match": etag} if etag else {})
+    if response.status_code == 304 and etag:
+        return cached_body
+    body = response.content.decode("utf-8")
+    if response.headers.get("ETag"):
+        etags[url] = [response.headers["ETag"], body]
+        _write_atomic(path, json_bytes(etags))
+    return body
@@ -10,6 +10,7 @@ Usage:
     python chat_with_agent.py              # Interactive chat with Gideon
     python chat_with_agent.py --curate     # Trigger full curation session
     python chat_with_agent.py --curate game-loop  # Curate specific topic
+    python chat_with_agent.py --curate game-loop signals  # Curate several topics at once
     python chat_with_agent.py --curator    # Chat with Curator directly
     python chat_with_agent.py --analyze    # Analyze learning progress
 """
@@ -17,75 +18,55 @@ Usage:
 import os
 import sys
 import json
-from letta_client import Letta
+import queue
+import threading
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from letta_client import APIError
+from _agent_client import (
+    send_message, stream_message, update_working_memory, compact_prompt, WORKING_MEMORY_TURNS
+)
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import readline  # noqa: F401 - enables line editing for input()
+except ImportError:
+    pass
 
-LETTA_BASE_URL = os.getenv("LETTA_BASE_URL", "http://localhost:8283")
-
-# Connect to local Letta server
-client = Letta(base_url=LETTA_BASE_URL)
-
-# Load agent IDs
 agent_file = os.path.join(os.path.dirname(__file__), "agent_ids.json")
 legacy_file = os.path.join(os.path.dirname(__file__), "agent_id.txt")
 
-if os.path.exists(agent_file):
-    with open(agent_file) as f:
-        agent_ids = json.load(f)
-    GIDEON_ID = agent_ids.get("gideon")
-    CURATOR_ID = agent_ids.get("curator")
-elif os.path.exists(legacy_file):
-    # Backward compatibility with old single-agent setup
-    with open(legacy_file) as f:
-        GIDEON_ID = f.read().strip()
-    CURATOR_ID = None
-    print("Note: Using legacy single-agent setup. Run setup_agents.py for multi-agent features.")
-else:
+
+@lru_cache(maxsize=1)
+def _load_ids():
+    """Load (gideon_id, curator_id) on first use rather than at import time."""
+    if os.path.exists(agent_file):
+        agent_ids = _json.loads(Path(agent_file).read_bytes())
+        return agent_ids.get("gideon"), agent_ids.get("curator")
+    if os.path.exists(legacy_file):
+        # Backward compatibility with old single-agent setup
+        print("Note: Using legacy single-agent setup. Run setup_agents.py for multi-agent features.")
+        return Path(legacy_file).read_text().strip(), None
     print("ERROR: Agent not found. Run setup_agents.py first.")
     exit(1)
 
 
-def send_message(agent_id: str, content: str, agent_name: str = "Agent"):
-    """Send a message and print the response."""
-    response = client.agents.messages.create(
-        agent_id=agent_id,
-        messages=[{"role": "user", "content": content}]
-    )
-
-    for message in response.messages:
-        if hasattr(message, 'reasoning') and message.reasoning:
-            print(f"\n[Thinking]: {message.reasoning[:300]}...")
-        if hasattr(message, 'content') and message.content:
-            print(f"\n[{agent_name}]: {message.content}")
-        if hasattr(message, 'tool_calls') and message.tool_calls:
-            for tc in message.tool_calls:
-                print(f"\n[Tool: {tc.function.name}]")
-                if hasattr(tc.function, 'arguments'):
-                    args = tc.function.arguments
-                    if len(str(args)) > 150:
-                        print(f"  Args: {str(args)[:150]}...")
-                    else:
-                        print(f"  Args: {args}")
-
-
-def curate_all():
-    """Trigger a full curation session with the Curator agent."""
-    if not CURATOR_ID:
-        print("Curator agent not available. Run setup_agents.py first.")
-        return
-
-    print("\nTriggering full curation session with Curator...")
-    send_message(CURATOR_ID, """
+# Curation prompts, compacted once at import rather than rebuilt on every call
+CURATE_ALL_PROMPT = compact_prompt("""
     Please perform a comprehensive curation session:
 
-    1. Use get_recent_conversations to see which topics have recent activity
-    2. For active topics, use get_conversation_details to understand what the student asked
-    3. Use get_student_progress to see overall learning status
-    4. Use get_current_extensions to see what has already been added
-    5. Based on your analysis:
+    1. Call get_curation_snapshot() once, then decide which add_* calls to make.
+       It returns recent conversations, progress, and existing extensions together.
+    2. Based on your analysis:
        - Identify knowledge gaps or confusion points
        - Search for 2-3 high-quality resources to address these gaps
-       - Add resources using add_resource
-       - If you see code-related questions, create helpful examples with add_code_example
+       - Add them all in one add_resources_bulk call
+       - If you see code-related questions, create helpful examples and add them with add_code_examples_bulk
        - If there's a significant confusion, consider generating a lesson with add_lesson
 
     Focus on:
@@ -95,45 +76,30 @@ def curate_all():
     - Clear, beginner-friendly explanations
 
     Update your memory with what you've learned about Mark's progress.
-    """, "Curator")
+    """)
 
+CURATE_TOPICS_TEMPLATE = compact_prompt("""
+    Please curate content specifically for these topics: {topic_ids}
 
-def curate_topic(topic_id: str):
-    """Trigger curation for a specific topic."""
-    if not CURATOR_ID:
-        print("Curator agent not available. Run setup_agents.py first.")
-        return
-
-    print(f"\nCurating content for topic: {topic_id}...")
-    send_message(CURATOR_ID, f"""
-    Please curate content specifically for the topic: {topic_id}
-
-    1. Use get_conversation_details('{topic_id}') to see what the student asked about this topic
-    2. Use get_student_notes('{topic_id}') to see their personal notes
-    3. Use get_current_extensions to check what's already been added
-    4. Based on the conversation and notes:
+    1. Call fetch_context_bundle once with topic_ids set to the JSON array string
+       {topic_ids} - it returns each topic's conversation, the student's notes
+       (in progress), and what's already been added
+    2. For each topic, based on the conversation and notes:
        - Identify specific questions or confusion points
        - Find 1-2 highly relevant resources
        - Create a code example if it would help clarify a concept
        - Consider generating a focused lesson if there's a pattern of confusion
+    3. Add the resources for all topics in a single add_resources_bulk call, and any
+       code examples in a single add_code_examples_bulk call
 
     Remember: Quality over quantity. Only add content that directly addresses Mark's needs.
-    """, "Curator")
-
-
-def analyze_progress():
-    """Have Curator analyze overall learning progress."""
-    if not CURATOR_ID:
-        print("Curator agent not available. Run setup_agents.py first.")
-        return
+    """)
 
-    print("\nAnalyzing learning progress...")
-    send_message(CURATOR_ID, """
+ANALYZE_PROMPT = compact_prompt("""
     Please analyze Mark's overall learning progress:
 
-    1. Use get_student_progress to see completion status across all topics
-    2. Use get_recent_conversations to see activity patterns
-    3. Use get_topics to understand the curriculum structure
+    1. Call get_curation_snapshot() once - it returns progress, conversation
+       activity, and the curriculum structure together
 
     Provide insights on:
     - Which topics has Mark spent the most time on?
@@ -142,7 +108,56 @@ def analyze_progress():
     - Are there any knowledge gaps that span multiple topics?
 
     Update your memory with these insights for future curation.
-    """, "Curator")
+    """)
+
+
+def curate_all():
+    """Trigger a full curation session with the Curator agent."""
+    _, curator_id = _load_ids()
+    if not curator_id:
+        print("Curator agent not available. Run setup_agents.py first.")
+        return
+
+    print("\nTriggering full curation session with Curator...")
+    send_message(curator_id, CURATE_ALL_PROMPT, "Curator")
+
+
+# Topics per curation prompt - larger batches degrade answer quality
+CURATE_BATCH_SIZE = 8
+
+
+def curate_topics(topic_ids: list[str]):
+    """Trigger curation for one or more topics, batched into as few prompts as possible."""
+    _, curator_id = _load_ids()
+    if not curator_id:
+        print("Curator agent not available. Run setup_agents.py first.")
+        return
+
+    for start in range(0, len(topic_ids), CURATE_BATCH_SIZE):
+        batch = topic_ids[start:start + CURATE_BATCH_SIZE]
+        print(f"\nCurating content for topics: {', '.join(batch)}...")
+        send_message(curator_id, CURATE_TOPICS_TEMPLATE.format(topic_ids=json.dumps(batch)), "Curator")
+
+
+def analyze_progress():
+    """Have Curator analyze overall learning progress."""
+    _, curator_id = _load_ids()
+    if not curator_id:
+        print("Curator agent not available. Run setup_agents.py first.")
+        return
+
+    print("\nAnalyzing learning progress...")
+    send_message(curator_id, ANALYZE_PROMPT, "Curator")
+
+
+def _read_input(lines: queue.Queue):
+    """Read user input on a background thread so the next prompt can be typed while a reply streams."""
+    while True:
+        try:
+            lines.put(input("\nYou: "))
+        except EOFError:
+            lines.put(None)
+            return
 
 
 def interactive(agent_id: str, agent_name: str):
@@ -151,9 +166,18 @@ def interactive(agent_id: str, agent_name: str):
     print("Commands: 'quit' to exit, 'curate' for curation, 'analyze' for progress analysis")
     print("-" * 50)
 
+    turns = deque(maxlen=WORKING_MEMORY_TURNS)
+    has_working_memory = True
+
+    lines = queue.Queue()
+    threading.Thread(target=_read_input, args=(lines,), daemon=True).start()
+
     while True:
         try:
-            user_input = input("\nYou: ").strip()
+            line = lines.get()
+            if line is None:
+                break
+            user_input = line.strip()
             if not user_input:
                 continue
             if user_input.lower() == 'quit':
@@ -165,10 +189,16 @@ def interactive(agent_id: str, agent_name: str):
                 analyze_progress()
                 continue
             if user_input.lower().startswith('curate '):
-                topic = user_input[7:].strip()
-                curate_topic(topic)
+                curate_topics(user_input[7:].split())
                 continue
-            send_message(agent_id, user_input, agent_name)
+            reply = stream_message(agent_id, user_input, agent_name)
+            if has_working_memory:
+                turns.append(f"User: {user_input}\n{agent_name}: {reply}")
+                try:
+                    has_working_memory = update_working_memory(agent_id, turns)
+                except APIError as e:
+                    # Keep the turns; the next update rewrites the whole window
+                    print(f"  [working_memory not updated: {e}]")
         except KeyboardInterrupt:
             print("\nGoodbye!")
             break
@@ -179,28 +209,36 @@ def main():
 
     if '--curate' in args:
         idx = args.index('--curate')
-        if idx + 1 < len(args) and not args[idx + 1].startswith('-'):
-            # Curate specific topic
-            curate_topic(args[idx + 1])
+        topic_ids = []
+        for arg in args[idx + 1:]:
+            if arg.startswith('-'):
+                break
+            topic_ids.append(arg)
+        if topic_ids:
+            # Curate specific topics
+            curate_topics(topic_ids)
         else:
             # Full curation
             curate_all()
     elif '--curator' in args:
-        if not CURATOR_ID:
+        _, curator_id = _load_ids()
+        if not curator_id:
             print("Curator agent not available. Run setup_agents.py first.")
             exit(1)
-        print(f"Connected to Curator: {CURATOR_ID}")
-        interactive(CURATOR_ID, "Curator")
+        print(f"Connected to Curator: {curator_id}")
+        interactive(curator_id, "Curator")
     elif '--analyze' in args:
         analyze_progress()
     elif len(args) > 0 and not args[0].startswith('-'):
         # Send single message to Gideon
-        print(f"Connected to Gideon: {GIDEON_ID}")
-        send_message(GIDEON_ID, ' '.join(args), "Gideon")
+        gideon_id, _ = _load_ids()
+        print(f"Connected to Gideon: {gideon_id}")
+        stream_message(gideon_id, ' '.join(args), "Gideon")
     else:
         # Interactive mode with Gideon
-        print(f"Connected to Gideon: {GIDEON_ID}")
-        interactive(GIDEON_ID, "Gideon")
+        gideon_id, _ = _load_ids()
+        print(f"Connected to Gideon: {gideon_id}")
+        interactive(gideon_id, "Gideon")
 
 
 if __name__ == "__main__":
@@ -17,11 +17,17 @@ Prerequisites:
 import os
 import sys
 import inspect
+import threading
+from textwrap import dedent
 import requests
-from letta_client import Letta
+from concurrent.futures import ThreadPoolExecutor
+from _agent_client import LETTA_BASE_URL, get_client, compact_prompt, write_atomic
+from tools import READ_ONLY_TOOLS, RUNTIME_SOURCE
+from _tool_runtime import (
+    SESSION, ToolError, app_get, app_post, cached_get, etag_get, json_loads, json_text, tool_error
+)
 
 # Configuration
-LETTA_BASE_URL = os.getenv("LETTA_BASE_URL", "http://localhost:8283")
 LEARNING_APP_URL = os.getenv("LEARNING_APP_URL")
 
 if not LEARNING_APP_URL:
@@ -34,12 +40,55 @@ if not LEARNING_APP_URL:
 		print("   or: python setup_agent.py http://localhost:5173")
 		sys.exit(1)
 
-# Initialize Letta client for LOCAL server (no api_key needed)
-client = Letta(base_url=LETTA_BASE_URL)
+# Shared Letta client for the LOCAL server
+client = get_client()
+
+# Status of each URL that has answered _check with a 2xx. Failures aren't kept,
+# so a server that was down a moment ago is seen once it's up
+_CHECKED = {}
+
+
+def _check(url: str) -> int:
+    """
+    Return the status code of a HEAD to url through SESSION, falling back to
+    GET when the server doesn't route HEAD (405). Successes are cached.
+    """
+    if url in _CHECKED:
+        return _CHECKED[url]
+    response = SESSION.head(url, timeout=2, allow_redirects=True)
+    if response.status_code == 405:
+        # A full GET, not a streamed one, so the connection goes back to the pool
+        response = SESSION.get(url, timeout=2)
+    if 200 <= response.status_code < 300:
+        _CHECKED[url] = response.status_code
+    return response.status_code
+
+
+def _prewarm_connections():
+    """
+    Open pooled connections to both servers so the first real request skips the handshake.
+    Only SESSION's pool is warmed - the Letta client keeps its own connections.
+    """
+    for url in (f"{LETTA_BASE_URL}/v1/health", f"{LEARNING_APP_URL}/api/letta"):
+        try:
+            _check(url)
+        except requests.RequestException:
+            pass  # main() reports unreachable servers
+
+
+threading.Thread(target=_prewarm_connections, daemon=True).start()
 
 # =============================================================================
 # Custom Tool Definitions
 # IMPORTANT: Each function must be self-contained with imports inside!
+# (Letta only keeps the function's source; after the first call a repeated
+# import is just a sys.modules lookup, so there is nothing to hoist.)
+# The one exception is _tool_runtime.py (SESSION and friends): tool_source()
+# prepends it to every uploaded tool, and in-process calls use the import above.
+# Tools stay synchronous: Letta runs read-only tools concurrently when the
+# model issues several at once (enable_parallel_execution below), and
+# multi-request tools fan out on a thread pool, which works whether or not
+# the sandbox already has an event loop running.
 # =============================================================================
 
 def make_get_topics(app_url: str):
@@ -53,16 +102,10 @@ def make_get_topics(app_url: str):
         Returns:
             str: JSON string of topics with id, title, category, and description
         """
-        import json
-        import requests
-
         try:
-            response = requests.get(f"{app_url}/api/letta?action=topics")
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
+            return cached_get("topics", f"{app_url}/api/letta?action=topics")
+        except ToolError as e:
+            return tool_error(*e.args)
 
     return get_topics
 
@@ -78,16 +121,10 @@ def make_get_recent_conversations(app_url: str):
         Returns:
             str: JSON string of notebooks with topic_id, title, message_count, last_updated
         """
-        import json
-        import requests
-
         try:
-            response = requests.get(f"{app_url}/api/letta?action=notebooks")
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
+            return app_get(f"{app_url}/api/letta?action=notebooks&format=columnar")
+        except ToolError as e:
+            return tool_error(*e.args)
 
     return get_recent_conversations
 
@@ -105,16 +142,12 @@ def make_get_conversation_details(app_url: str):
         Returns:
             str: JSON string of conversation messages for that topic
         """
-        import json
-        import requests
+        from urllib.parse import quote
 
         try:
-            response = requests.get(f"{app_url}/api/letta?action=notebook&topicId={topic_id}")
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
+            return app_get(f"{app_url}/api/letta?action=notebook&topicId={quote(topic_id, safe='')}")
+        except ToolError as e:
+            return tool_error(*e.args)
 
     return get_conversation_details
 
@@ -129,20 +162,96 @@ def make_get_current_extensions(app_url: str):
         Returns:
             str: JSON string of all dynamically added resources and code examples
         """
-        import json
-        import requests
-
         try:
-            response = requests.get(f"{app_url}/api/letta?action=extensions")
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
+            return etag_get(f"{app_url}/api/letta?action=extensions&format=columnar")
+        except ToolError as e:
+            return tool_error(*e.args)
 
     return get_current_extensions
 
 
+def make_get_curation_snapshot(app_url: str):
+    """Factory to create get_curation_snapshot tool with embedded URL."""
+    def get_curation_snapshot() -> str:
+        """
+        Get an overview for a curation pass in a single call: curriculum topics,
+        each notebook's latest messages, student progress, and the titles of the
+        resources/code examples already added. Long text is truncated, marked with
+        "[... more chars truncated]", and older messages are counted in omittedMessages.
+        Call this once at the start of curation instead of the individual get_* tools,
+        then fetch_context_bundle for the full detail of the topics you pick.
+
+        Returns:
+            str: JSON string with topics, notebooks, progress, and extensions
+        """
+        try:
+            return app_get(f"{app_url}/api/letta?action=snapshot&format=columnar")
+        except ToolError as e:
+            return tool_error(*e.args)
+
+    return get_curation_snapshot
+
+
+def make_fetch_context_bundle(app_url: str):
+    """Factory to create fetch_context_bundle tool with embedded URL."""
+    def fetch_context_bundle(topic_ids: str) -> str:
+        """
+        Fetch conversations, notes/progress, and existing extensions for several topics at once.
+        The requests run in parallel, so this is much faster than calling
+        get_conversation_details and get_current_extensions one topic at a time.
+
+        Args:
+            topic_ids: JSON array of topic IDs (e.g., '["game-loop", "signals"]')
+
+        Returns:
+            str: JSON string with notebooks per topic, progress, and those topics' extensions
+        """
+        from urllib.parse import quote
+        from concurrent.futures import ThreadPoolExecutor
+
+        try:
+            ids = json_loads(topic_ids) if isinstance(topic_ids, str) else topic_ids
+        except ValueError as e:
+            return tool_error(f"topic_ids must be a JSON array: {e}")
+        if not isinstance(ids, list) or not all(isinstance(topic_id, str) for topic_id in ids):
+            return tool_error("topic_ids must be a JSON array of topic ID strings")
+
+        try:
+            # (cache kind, URL) per request: the same URLs and caches as the
+            # single-topic tools, so their responses serve each other. Extensions
+            # (kind None) go through the ETag cache, like get_current_extensions
+            sources = {
+                "extensions": (None, f"{app_url}/api/letta?action=extensions&format=columnar"),
+                "progress": ("progress", f"{app_url}/api/progress"),
+            }
+            for topic_id in ids:
+                sources[("notebook", topic_id)] = (
+                    "notebook", f"{app_url}/api/letta?action=notebook&topicId={quote(topic_id, safe='')}"
+                )
+
+            with ThreadPoolExecutor(max_workers=min(len(sources), 16)) as pool:
+                results = dict(zip(sources, pool.map(
+                    lambda source: json_loads(cached_get(*source) if source[0] else etag_get(source[1])),
+                    sources.values()
+                )))
+            extensions = results["extensions"].get("extensions", {})
+
+            return json_text({
+                "notebooks": {topic_id: results[("notebook", topic_id)].get("notebook") for topic_id in ids},
+                "progress": results["progress"],
+                # Just the requested topics, so a narrow bundle stays small
+                "extensions": {
+                    topic_id: extensions[topic_id] for topic_id in ids if topic_id in extensions
+                }
+            })
+        except ToolError as e:
+            return tool_error(*e.args)
+        except ValueError as e:
+            return tool_error(f"Learning app returned invalid JSON: {e}")
+
+    return fetch_context_bundle
+
+
 def make_add_resource(app_url: str):
     """Factory to create add_resource tool with embedded URL."""
     def add_resource(topic_id: str, title: str, url: str, resource_type: str) -> str:
@@ -159,25 +268,16 @@ def make_add_resource(app_url: str):
         Returns:
             str: JSON confirmation of the added resource
         """
-        import json
-        import requests
-
         try:
-            response = requests.post(
-                f"{app_url}/api/letta",
-                json={
-                    "action": "add_resource",
-                    "topicId": topic_id,
-                    "title": title,
-                    "url": url,
-                    "type": resource_type
-                }
-            )
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code} - {response.text}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
+            return app_post(f"{app_url}/api/letta", {
+                "action": "add_resource",
+                "topicId": topic_id,
+                "title": title,
+                "url": url,
+                "type": resource_type
+            })
+        except ToolError as e:
+            return tool_error(*e.args)
 
     return add_resource
 
@@ -199,35 +299,237 @@ def make_add_code_example(app_url: str):
         Returns:
             str: JSON confirmation of the added code example
         """
-        import json
-        import requests
+        try:
+            return app_post(f"{app_url}/api/letta", {
+                "action": "add_code_example",
+                "topicId": topic_id,
+                "title": title,
+                "language": language,
+                "code": code,
+                "explanation": explanation
+            })
+        except ToolError as e:
+            return tool_error(*e.args)
+
+    return add_code_example
+
+
+def make_add_resources_bulk(app_url: str):
+    """Factory to create add_resources_bulk tool with embedded URL."""
+    def add_resources_bulk(items: str) -> str:
+        """
+        Add several learning resources in one call. Prefer this over repeated add_resource
+        calls: collect all the resources you want to add, then call this once at the end.
+
+        Args:
+            items: JSON array of resources, each with topic_id, title, url, and type
+                (one of 'docs', 'source', 'book', 'video'), e.g.
+                '[{"topic_id": "signals", "title": "...", "url": "...", "type": "docs"}]'
 
+        Returns:
+            str: JSON summary of how many resources were added and any per-item errors
+        """
         try:
-            response = requests.post(
-                f"{app_url}/api/letta",
-                json={
-                    "action": "add_code_example",
-                    "topicId": topic_id,
-                    "title": title,
-                    "language": language,
-                    "code": code,
-                    "explanation": explanation
-                }
+            items_list = json_loads(items) if isinstance(items, str) else items
+        except ValueError as e:
+            return tool_error(f"items must be a JSON array: {e}")
+        if not isinstance(items_list, list) or not all(isinstance(item, dict) for item in items_list):
+            return tool_error("items must be a JSON array of objects")
+
+        payload = [
+            {
+                "topicId": item.get("topic_id"),
+                "title": item.get("title"),
+                "url": item.get("url"),
+                "type": item.get("type")
+            }
+            for item in items_list
+        ]
+        try:
+            # Bulk writes get a longer read budget than single-item calls
+            return app_post(f"{app_url}/api/letta", {"action": "add_resources_bulk", "items": payload}, timeout=(3, 30))
+        except ToolError as e:
+            return tool_error(*e.args)
+
+    return add_resources_bulk
+
+
+def make_add_code_examples_bulk(app_url: str):
+    """Factory to create add_code_examples_bulk tool with embedded URL."""
+    def add_code_examples_bulk(items: str) -> str:
+        """
+        Add several code examples in one call. Prefer this over repeated add_code_example
+        calls: collect all the examples you want to add, then call this once at the end.
+
+        Args:
+            items: JSON array of examples, each with topic_id, title, language
+                (one of 'gdscript', 'python', 'typescript', 'cpp'), code, and explanation
+
+        Returns:
+            str: JSON summary of how many examples were added and any per-item errors
+        """
+        try:
+            items_list = json_loads(items) if isinstance(items, str) else items
+        except ValueError as e:
+            return tool_error(f"items must be a JSON array: {e}")
+        if not isinstance(items_list, list) or not all(isinstance(item, dict) for item in items_list):
+            return tool_error("items must be a JSON array of objects")
+
+        payload = [
+            {
+                "topicId": item.get("topic_id"),
+                "title": item.get("title"),
+                "language": item.get("language"),
+                "code": item.get("code"),
+                "explanation": item.get("explanation")
+            }
+            for item in items_list
+        ]
+        try:
+            return app_post(f"{app_url}/api/letta", {"action": "add_code_examples_bulk", "items": payload}, timeout=(3, 30))
+        except ToolError as e:
+            return tool_error(*e.args)
+
+    return add_code_examples_bulk
+
+
+def make_compress_memory(app_url: str):
+    """Factory to create compress_memory tool with embedded URL."""
+    def compress_memory(summary: str) -> str:
+        """
+        Replace the learning_progress memory block with a compact summary when it is nearly full.
+        Write the summary yourself: keep the student's key struggles, strengths, and next steps,
+        and drop details that are no longer useful. Nothing is written unless the block is
+        over 80% of its limit, so it is safe to call after every curation session.
+
+        Args:
+            summary: The compressed learning_progress text to store
+
+        Returns:
+            str: JSON describing whether the block was compressed and its size before/after
+        """
+        try:
+            blocks = json_loads(app_get(f"{app_url}/api/letta/memory")).get("memoryBlocks", [])
+            block = next((b for b in blocks if b["label"] == "learning_progress"), None)
+            if not block:
+                return tool_error("learning_progress block not found")
+
+            used = len(block["value"])
+            limit = block.get("limit") or 4000
+            if used < 0.8 * limit:
+                return json_text({"compressed": False, "used": used, "limit": limit})
+
+            app_post(f"{app_url}/api/letta/memory", {"blockLabel": "learning_progress", "value": summary})
+            return json_text({"compressed": True, "before": used, "after": len(summary), "limit": limit})
+        except ToolError as e:
+            return tool_error(*e.args)
+        except ValueError as e:
+            return tool_error(f"Learning app returned invalid JSON: {e}")
+
+    return compress_memory
+
+
+def make_upsert_memory(app_url: str):
+    """Factory to create upsert_memory tool (local SQLite store; app_url unused)."""
+    def upsert_memory(topic_id: str, note: str) -> str:
+        """
+        Save an observation about the student to long-term memory (a local SQLite store).
+        Use this for details - specific struggles, questions, breakthroughs - instead of
+        growing the learning_progress block. Saving the same note twice is a no-op.
+
+        Args:
+            topic_id: The topic the note is about (e.g., 'signals'), or 'general'
+            note: The observation to remember
+
+        Returns:
+            str: JSON confirmation of whether the note was saved
+        """
+        import os
+        import time
+        import sqlite3
+
+        db_path = os.path.expanduser("~/.cache/letta_agent_memory.db")
+        try:
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            with sqlite3.connect(db_path) as db:
+                try:
+                    db.execute(
+                        "CREATE VIRTUAL TABLE IF NOT EXISTS memories "
+                        "USING fts5(topic_id, note, created_at UNINDEXED)"
+                    )
+                except sqlite3.OperationalError:
+                    # SQLite built without FTS5 - fall back to a plain table searched with LIKE
+                    db.execute("CREATE TABLE IF NOT EXISTS memories (topic_id TEXT, note TEXT, created_at TEXT)")
+                exists = db.execute(
+                    "SELECT 1 FROM memories WHERE topic_id = ? AND note = ?", (topic_id, note)
+                ).fetchone()
+                if not exists:
+                    db.execute(
+                        "INSERT INTO memories (topic_id, note, created_at) VALUES (?, ?, ?)",
+                        (topic_id, note, time.strftime("%Y-%m-%dT%H:%M:%S"))
+                    )
+            return json_text({"saved": not exists, "topicId": topic_id})
+        except sqlite3.Error as e:
+            return tool_error(f"Could not save memory: {e}")
+
+    return upsert_memory
+
+
+def make_search_memory(app_url: str):
+    """Factory to create search_memory tool (local SQLite store; app_url unused)."""
+    def search_memory(query: str, limit: int = 5) -> str:
+        """
+        Search long-term memory for past observations about the student.
+        Use this to recall specifics on demand (e.g., "what does Mark struggle with in signals")
+        rather than keeping everything in the learning_progress block.
+
+        Args:
+            query: Words to search for
+            limit: Maximum number of notes to return (default 5)
+
+        Returns:
+            str: JSON array of matching notes with topic_id, note, and created_at
+        """
+        import os
+        import re
+        import sqlite3
+
+        db_path = os.path.expanduser("~/.cache/letta_agent_memory.db")
+        words = re.findall(r"\w+", query)
+        if not words or not os.path.exists(db_path):
+            return "[]"
+        try:
+            with sqlite3.connect(db_path) as db:
+                schema = db.execute("SELECT sql FROM sqlite_master WHERE name = 'memories'").fetchone()
+                if not schema:
+                    return "[]"
+                if "fts5" in schema[0].lower():
+                    rows = db.execute(
+                        "SELECT topic_id, note, created_at FROM memories WHERE memories MATCH ? "
+                        "ORDER BY rank LIMIT ?",
+                        (" OR ".join(f'"{word}"' for word in words), limit)
+                    ).fetchall()
+                else:
+                    clause = " OR ".join("note LIKE ?" for _ in words)
+                    rows = db.execute(
+                        f"SELECT topic_id, note, created_at FROM memories WHERE {clause} "
+                        "ORDER BY created_at DESC LIMIT ?",
+                        [f"%{word}%" for word in words] + [limit]
+                    ).fetchall()
+            return json_text(
+                [{"topic_id": t, "note": n, "created_at": c} for t, n, c in rows]
             )
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code} - {response.text}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
+        except sqlite3.Error as e:
+            return tool_error(f"Could not search memory: {e}")
 
-    return add_code_example
+    return search_memory
 
 
 # =============================================================================
 # Agent Configuration
 # =============================================================================
 
-AGENT_PERSONA = """
+AGENT_PERSONA = compact_prompt("""
 I am a learning curator agent for a Godot game engine learning application.
 
 My primary responsibilities:
@@ -252,44 +554,109 @@ Topics in the curriculum:
 - state-machines: State Machines (patterns)
 
 When curating content, I should:
-- Check what topics have recent conversations (student activity)
+- Call get_curation_snapshot once to see topics, recent conversations, progress,
+  and existing content together
 - Review conversation details to understand specific questions/struggles
 - Search for relevant resources (official docs, tutorials, videos, source code)
 - Add resources that directly address the student's needs
 - Avoid adding duplicate content
+- Collect all resources in one list and call add_resources_bulk once at the end
+  (and add_code_examples_bulk for code examples) instead of adding items one by one
 - Focus on practical, beginner-friendly resources
 - Prioritize official Godot documentation and well-known game dev resources
-"""
 
-HUMAN_CONTEXT = """
+To keep my context small:
+- working_memory only holds the last few conversation turns; older detail belongs
+  in learning_progress as a summary, not verbatim
+- learning_progress is only a short summary; detailed observations go to
+  upsert_memory and I recall them with search_memory when relevant
+- When learning_progress grows large, I rewrite it as a compact summary and save
+  it with compress_memory
+- Lists from get_recent_conversations, get_current_extensions, and
+  get_curation_snapshot may come as {"columns": [...], "rows": [[...], ...]}:
+  each row holds one item's values in column order
+""")
+
+HUMAN_CONTEXT = compact_prompt("""
 Name: Mark
 Background: Experienced Python developer, new to game development
 Current project: Building a tic-tac-toe game in Godot to learn engine internals
 Learning style: Prefers understanding concepts deeply before implementation
 Goals: Understand how game engines work under the hood, not just use them
-"""
-
-
-def create_tool_from_source(client, func, app_url: str):
-    """Create a Letta tool from a factory function with embedded URL."""
-    # Get the inner function
-    inner_func = func(app_url)
-
-    # Get the source code of the inner function
-    source = inspect.getsource(inner_func)
+""")
+
+
+# Read-only tools can be executed concurrently when the model issues several at once.
+# Taken from tools.py by name so a mutating tool can't become parallel through its prefix
+PARALLEL_SAFE_TOOLS = frozenset(func.__name__ for func in READ_ONLY_TOOLS)
+
+
+# Tools registered by this process, keyed by (name, app_url)
+_TOOL_CACHE = {}
+
+
+def tool_template(func) -> str:
+    """
+    Return the dedented source of a factory's inner function.
+    Cached on the factory so repeated setups skip the inspect machinery.
+    """
+    template = getattr(func, "_template", None)
+    if template is None:
+        # Get the source code of the inner function (the URL doesn't affect it)
+        # and remove its indentation (since it's a nested function)
+        template = dedent(inspect.getsource(func("{app_url}")))
+        func._template = template
+    return template
+
+
+def tool_source(func, app_url: str) -> str:
+    """
+    Return a factory's tool source with app_url baked in as a literal and the
+    shared runtime prepended, so the uploaded tool runs in a fresh interpreter
+    without the factory's closure.
+    """
+    # The URL lands inside f-string literals, so it can't contain quotes or braces
+    if any(char in app_url for char in "{}\"'\\"):
+        raise ValueError(f"Cannot embed LEARNING_APP_URL in tool source: {app_url!r}")
+
+    # The source has f"{app_url}..." which we replace with the literal URL
+    source = tool_template(func).replace("{app_url}", app_url)
+    if "app_url" in source:
+        raise ValueError(f"{func.__name__} uses app_url outside an f-string placeholder")
+    return f"{RUNTIME_SOURCE}\n\n{source}"
+
+
+def create_tools_from_sources(client, tool_factories, app_url: str):
+    """
+    Create Letta tools from (name, factory) pairs with embedded URL.
+    All sources are built up front and uploaded concurrently. Uploads use
+    upsert so re-running setup updates the existing tool rows, and tools
+    already registered in this process are reused without a round trip.
+
+    Returns:
+        list of (name, tool or Exception) in the same order as tool_factories
+    """
+    pending = [
+        (name, tool_source(factory, app_url), name in PARALLEL_SAFE_TOOLS)
+        for name, factory in tool_factories
+        if (name, app_url) not in _TOOL_CACHE
+    ]
 
-    # Remove indentation (since it's a nested function)
-    lines = source.split('\n')
-    min_indent = min(len(line) - len(line.lstrip()) for line in lines if line.strip())
-    source = '\n'.join(line[min_indent:] if line.strip() else '' for line in lines)
+    def create(source, parallel):
+        try:
+            return client.tools.upsert(source_code=source, enable_parallel_execution=parallel)
+        except Exception as e:
+            return e
 
-    # Replace the closure variable with the actual URL string
-    # The source code has f"{app_url}..." which we need to replace with the literal URL
-    source = source.replace('{app_url}', app_url)
+    results = {}
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            for (name, _, _), result in zip(pending, pool.map(lambda item: create(item[1], item[2]), pending)):
+                results[name] = result
+                if not isinstance(result, Exception):
+                    _TOOL_CACHE[(name, app_url)] = result
 
-    # Create the tool from source code
-    tool = client.tools.create(source_code=source)
-    return tool
+    return [(name, results[name] if name in results else _TOOL_CACHE[(name, app_url)]) for name, _ in tool_factories]
 
 
 def create_agent():
@@ -308,17 +675,23 @@ def create_agent():
         ("get_recent_conversations", make_get_recent_conversations),
         ("get_conversation_details", make_get_conversation_details),
         ("get_current_extensions", make_get_current_extensions),
+        ("get_curation_snapshot", make_get_curation_snapshot),
+        ("fetch_context_bundle", make_fetch_context_bundle),
         ("add_resource", make_add_resource),
-        ("add_code_example", make_add_code_example)
+        ("add_code_example", make_add_code_example),
+        ("add_resources_bulk", make_add_resources_bulk),
+        ("add_code_examples_bulk", make_add_code_examples_bulk),
+        ("compress_memory", make_compress_memory),
+        ("upsert_memory", make_upsert_memory),
+        ("search_memory", make_search_memory)
     ]
 
-    for name, factory in tool_factories:
-        try:
-            tool = create_tool_from_source(client, factory, LEARNING_APP_URL)
-            tools.append(tool.name)
-            print(f"  ✓ Created tool: {tool.name}")
-        except Exception as e:
-            print(f"  ✗ Failed to create tool {name}: {e}")
+    for name, result in create_tools_from_sources(client, tool_factories, LEARNING_APP_URL):
+        if isinstance(result, Exception):
+            print(f"  ✗ Failed to create tool {name}: {result}")
+        else:
+            tools.append(result.name)
+            print(f"  ✓ Created tool: {result.name}")
 
     if not tools:
         print("\n⚠️  No tools created. Agent will only have web_search.")
@@ -329,9 +702,14 @@ def create_agent():
     agent = client.agents.create(
         name="godot-learning-curator",
         model="anthropic/claude-sonnet-4-20250514",
+        model_settings={"provider_type": "anthropic", "parallel_tool_calls": True},
         embedding="letta/letta-free",  # Free embeddings for local
         context_window_limit=16000,  # Limit context to control costs
         enable_sleeptime=True,  # Enable background processing!
+        # Blocks are compiled into the system prompt in this order. Rarely-edited
+        # blocks come first so the provider's prompt cache can reuse that prefix;
+        # blocks that change during curation stay below them. Persona and human
+        # stay writable - the agent's own edits there only cost one cache miss.
         memory_blocks=[
             {
                 "label": "persona",
@@ -346,12 +724,17 @@ def create_agent():
             {
                 "label": "learning_progress",
                 "value": "No learning sessions analyzed yet. Use get_recent_conversations to see student activity.",
-                "limit": 4000
+                "limit": 500
             },
             {
                 "label": "curated_content",
                 "value": "No content curated yet. Use get_current_extensions to see what has been added.",
                 "limit": 2000
+            },
+            {
+                "label": "working_memory",
+                "value": "No recent conversation turns yet.",
+                "limit": 1500
             }
         ],
         tools=tools + ["web_search"],
@@ -376,7 +759,7 @@ def test_agent(agent_id: str):
         agent_id=agent_id,
         messages=[{
             "role": "user",
-            "content": "Please check the learning app for recent student conversations and identify any topics where you could add helpful resources. Start by getting the list of topics and recent notebooks."
+            "content": "Please check the learning app for recent student conversations and identify any topics where you could add helpful resources. Start by calling get_curation_snapshot."
         }]
     )
 
@@ -397,13 +780,13 @@ def main():
     # Check if Letta server is running
     print("\nChecking Letta server...")
     try:
-        response = requests.get(f"{LETTA_BASE_URL}/v1/health", timeout=5)
-        if response.ok:
+        status = _check(f"{LETTA_BASE_URL}/v1/health")
+        if 200 <= status < 300:
             print(f"✓ Letta server is running at {LETTA_BASE_URL}")
         else:
-            print(f"✗ Letta server returned {response.status_code}")
+            print(f"✗ Letta server returned {status}")
             exit(1)
-    except Exception as e:
+    except requests.RequestException as e:
         print(f"✗ Cannot reach Letta server: {e}")
         print("\nStart the server first:")
         print("  source .venv/bin/activate")
@@ -413,12 +796,12 @@ def main():
     # Check if learning app is running
     print("\nChecking learning app...")
     try:
-        response = requests.get(f"{LEARNING_APP_URL}/api/letta", timeout=5)
-        if response.ok:
+        status = _check(f"{LEARNING_APP_URL}/api/letta")
+        if 200 <= status < 300:
             print(f"✓ Learning app is running at {LEARNING_APP_URL}")
         else:
-            print(f"✗ Learning app returned {response.status_code}")
-    except Exception as e:
+            print(f"✗ Learning app returned {status}")
+    except requests.RequestException as e:
         print(f"✗ Cannot reach learning app: {e}")
         print(f"  Make sure your app is running at {LEARNING_APP_URL}")
         proceed = input("\nContinue anyway? (y/n): ").strip().lower()
@@ -430,8 +813,7 @@ def main():
 
     # Save agent ID for later use
     agent_file = os.path.join(os.path.dirname(__file__), "agent_id.txt")
-    with open(agent_file, "w") as f:
-        f.write(agent.id)
+    write_atomic(agent_file, agent.id.encode())
     print(f"\n✓ Agent ID saved to: {agent_file}")
 
     # Ask if user wants to test
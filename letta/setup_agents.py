@@ -18,12 +18,18 @@ Prerequisites:
 import os
 import sys
 import json
-import inspect
 import requests
-from letta_client import Letta
+from concurrent.futures import ThreadPoolExecutor
+import tools
+from _tool_runtime import SESSION
+from _agent_client import LETTA_BASE_URL, get_client, compact_prompt, write_atomic
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration
-LETTA_BASE_URL = os.getenv("LETTA_BASE_URL", "http://localhost:8283")
 LEARNING_APP_URL = os.getenv("LEARNING_APP_URL")
 
 if not LEARNING_APP_URL:
@@ -36,359 +42,46 @@ if not LEARNING_APP_URL:
 		print("   or: python setup_agents.py http://localhost:5173")
 		sys.exit(1)
 
-# Initialize Letta client for LOCAL server (no api_key needed)
-client = Letta(base_url=LETTA_BASE_URL)
+# Shared Letta client for the LOCAL server
+client = get_client()
 
 # =============================================================================
 # Custom Tool Definitions
-# Tools read LEARNING_APP_URL from environment at runtime - no hardcoded URLs
-# Each function must be self-contained with imports inside
+# The tools live in tools.py and read LEARNING_APP_URL from the environment at
+# runtime, so nothing is embedded per app_url. The make_* factories below are
+# kept for backward compat but just return the runtime versions.
 # =============================================================================
 
-def get_topics() -> str:
-    """
-    Get all available topics in the Godot learning curriculum.
-    Returns a list of topics with their IDs, titles, and descriptions.
-    Use this to understand what topics exist before adding resources.
-
-    Returns:
-        str: JSON string of topics with id, title, category, and description
-    """
-    import os
-    import json
-    import requests
-
-    app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
-    try:
-        response = requests.get(f"{app_url}/api/letta?action=topics")
-        if response.ok:
-            return json.dumps(response.json(), indent=2)
-        return f"Error: {response.status_code}"
-    except Exception as e:
-        return f"Error connecting to learning app at {app_url}: {e}"
-
-
-# Keep factory for backward compat but it just returns the runtime version
-def make_get_topics(app_url: str):
-    """Deprecated: URL is now read from LEARNING_APP_URL env var at runtime."""
-    return get_topics
-
-
-def make_get_recent_conversations(app_url: str):
-    """Factory to create get_recent_conversations tool with embedded URL."""
-    def get_recent_conversations() -> str:
-        """
-        Get summaries of recent chat conversations from the learning notebooks.
-        Use this to understand what the student has been studying and asking about.
-        Returns notebook metadata including topic IDs and message counts.
-
-        Returns:
-            str: JSON string of notebooks with topic_id, title, message_count, last_updated
-        """
-        import json
-        import requests
-
-        try:
-            response = requests.get(f"{app_url}/api/letta?action=notebooks")
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
-
-    return get_recent_conversations
-
-
-def make_get_conversation_details(app_url: str):
-    """Factory to create get_conversation_details tool with embedded URL."""
-    def get_conversation_details(topic_id: str) -> str:
-        """
-        Get the full conversation history for a specific topic.
-        Use this to analyze what questions the student asked and what they're struggling with.
-
-        Args:
-            topic_id: The ID of the topic (e.g., 'game-loop', 'signals', 'scene-tree')
-
-        Returns:
-            str: JSON string of conversation messages for that topic
-        """
-        import json
-        import requests
-
-        try:
-            response = requests.get(f"{app_url}/api/letta?action=notebook&topicId={topic_id}")
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
-
-    return get_conversation_details
-
-
-def make_get_current_extensions(app_url: str):
-    """Factory to create get_current_extensions tool with embedded URL."""
-    def get_current_extensions() -> str:
-        """
-        Get all resources and code examples that have been dynamically added.
-        Use this to see what content has already been curated to avoid duplicates.
-
-        Returns:
-            str: JSON string of all dynamically added resources and code examples
-        """
-        import json
-        import requests
-
-        try:
-            response = requests.get(f"{app_url}/api/letta?action=extensions")
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
-
-    return get_current_extensions
-
-
-def make_get_student_progress(app_url: str):
-    """Factory to create get_student_progress tool with embedded URL."""
-    def get_student_progress() -> str:
-        """
-        Get the student's learning progress across all topics.
-        Shows which topics are completed, exercises done, and last visit times.
-        Use this to understand the student's learning journey and identify focus areas.
-
-        Returns:
-            str: JSON string of progress data per topic
-        """
-        import json
-        import requests
-
-        try:
-            response = requests.get(f"{app_url}/api/progress")
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
-
-    return get_student_progress
-
-
-def make_get_student_notes(app_url: str):
-    """Factory to create get_student_notes tool with embedded URL."""
-    def get_student_notes(topic_id: str) -> str:
-        """
-        Get the student's personal notes for a specific topic.
-        Notes contain the student's own insights, questions, and reflections.
-        Use this to understand what the student found important or confusing.
-
-        Args:
-            topic_id: The ID of the topic (e.g., 'game-loop', 'signals', 'scene-tree')
-
-        Returns:
-            str: The student's notes for that topic, or empty if none
-        """
-        import json
-        import requests
-
-        try:
-            response = requests.get(f"{app_url}/api/progress")
-            if response.ok:
-                data = response.json()
-                topic_progress = data.get('topics', {}).get(topic_id, {})
-                notes = topic_progress.get('notes', '')
-                return json.dumps({
-                    'topicId': topic_id,
-                    'notes': notes,
-                    'hasNotes': bool(notes.strip())
-                }, indent=2)
-            return f"Error: {response.status_code}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
-
-    return get_student_notes
-
+get_topics = tools.get_topics
 
-def make_add_resource(app_url: str):
-    """Factory to create add_resource tool with embedded URL."""
-    def add_resource(topic_id: str, title: str, url: str, resource_type: str) -> str:
-        """
-        Add a learning resource to a topic in the Godot learning app.
-        The resource will appear in the topic's Resources section.
 
-        Args:
-            topic_id: The topic ID (e.g., 'game-loop', 'signals', 'scene-tree')
-            title: Display title for the resource
-            url: URL to the resource
-            resource_type: One of 'docs', 'source', 'book', 'video'
+def _legacy_factory(tool):
+    """Build a deprecated make_<name>(app_url) factory for a tools.py function."""
+    def factory(app_url: str):
+        """Deprecated: URL is now read from LEARNING_APP_URL env var at runtime."""
+        return tool
 
-        Returns:
-            str: JSON confirmation of the added resource
-        """
-        import json
-        import requests
+    factory.__name__ = factory.__qualname__ = f"make_{tool.__name__}"
+    return factory
 
-        try:
-            response = requests.post(
-                f"{app_url}/api/letta",
-                json={
-                    "action": "add_resource",
-                    "topicId": topic_id,
-                    "title": title,
-                    "url": url,
-                    "type": resource_type
-                }
-            )
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code} - {response.text}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
-
-    return add_resource
-
-
-def make_add_code_example(app_url: str):
-    """Factory to create add_code_example tool with embedded URL."""
-    def add_code_example(topic_id: str, title: str, language: str, code: str, explanation: str) -> str:
-        """
-        Add a code example to a topic in the Godot learning app.
-        The example will appear in the topic's Code Examples section.
-
-        Args:
-            topic_id: The topic ID (e.g., 'game-loop', 'signals', 'scene-tree')
-            title: Display title for the code example
-            language: Programming language - one of 'gdscript', 'python', 'typescript', 'cpp'
-            code: The actual code snippet
-            explanation: Explanation of what the code does and why it's useful
-
-        Returns:
-            str: JSON confirmation of the added code example
-        """
-        import json
-        import requests
-
-        try:
-            response = requests.post(
-                f"{app_url}/api/letta",
-                json={
-                    "action": "add_code_example",
-                    "topicId": topic_id,
-                    "title": title,
-                    "language": language,
-                    "code": code,
-                    "explanation": explanation
-                }
-            )
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code} - {response.text}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
-
-    return add_code_example
-
-
-def make_add_lesson(app_url: str):
-    """Factory to create add_lesson tool with embedded URL."""
-    def add_lesson(
-        topic_id: str,
-        title: str,
-        difficulty: str,
-        introduction: str,
-        concepts: str,
-        explanation: str,
-        exercises: str,
-        connections: str,
-        generated_for: str
-    ) -> str:
-        """
-        Generate and add a structured lesson to a topic.
-        Lessons are comprehensive learning materials created based on student needs.
-
-        Args:
-            topic_id: The topic ID (e.g., 'game-loop', 'signals')
-            title: Lesson title (e.g., "Understanding Delta Time in Practice")
-            difficulty: One of 'beginner', 'intermediate', 'advanced'
-            introduction: Why this lesson matters to the student (1-2 paragraphs)
-            concepts: Key points as JSON array of strings (e.g., '["point 1", "point 2"]')
-            explanation: Deep explanation in markdown format
-            exercises: Practice prompts as JSON array of strings
-            connections: Links to other topics as JSON array of strings
-            generated_for: What triggered this lesson (e.g., "User asked about delta time")
-
-        Returns:
-            str: JSON confirmation of the added lesson
-        """
-        import json
-        import requests
-
-        try:
-            # Parse JSON arrays
-            concepts_list = json.loads(concepts) if isinstance(concepts, str) else concepts
-            exercises_list = json.loads(exercises) if isinstance(exercises, str) else exercises
-            connections_list = json.loads(connections) if isinstance(connections, str) else connections
-
-            response = requests.post(
-                f"{app_url}/api/letta/lessons",
-                json={
-                    "topicId": topic_id,
-                    "title": title,
-                    "difficulty": difficulty,
-                    "content": {
-                        "introduction": introduction,
-                        "concepts": concepts_list,
-                        "explanation": explanation,
-                        "exercises": exercises_list,
-                        "connections": connections_list
-                    },
-                    "generatedFor": generated_for
-                }
-            )
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code} - {response.text}"
-        except Exception as e:
-            return f"Error: {e}"
-
-    return add_lesson
-
-
-def make_get_lessons(app_url: str):
-    """Factory to create get_lessons tool with embedded URL."""
-    def get_lessons(topic_id: str = "") -> str:
-        """
-        Get all generated lessons, optionally filtered by topic.
-
-        Args:
-            topic_id: Optional topic ID to filter lessons. If empty, returns all lessons.
-
-        Returns:
-            str: JSON string of lessons
-        """
-        import json
-        import requests
-
-        try:
-            url = f"{app_url}/api/letta/lessons"
-            if topic_id:
-                url += f"?topicId={topic_id}"
-            response = requests.get(url)
-            if response.ok:
-                return json.dumps(response.json(), indent=2)
-            return f"Error: {response.status_code}"
-        except Exception as e:
-            return f"Error connecting to learning app: {e}"
 
-    return get_lessons
+make_get_topics = _legacy_factory(tools.get_topics)
+make_get_recent_conversations = _legacy_factory(tools.get_recent_conversations)
+make_get_conversation_details = _legacy_factory(tools.get_conversation_details)
+make_get_current_extensions = _legacy_factory(tools.get_current_extensions)
+make_get_student_progress = _legacy_factory(tools.get_student_progress)
+make_get_student_notes = _legacy_factory(tools.get_student_notes)
+make_add_resource = _legacy_factory(tools.add_resource)
+make_add_code_example = _legacy_factory(tools.add_code_example)
+make_add_lesson = _legacy_factory(tools.add_lesson)
+make_get_lessons = _legacy_factory(tools.get_lessons)
 
 
 # =============================================================================
 # Agent Personas
 # =============================================================================
 
-GIDEON_PERSONA = """
+GIDEON_PERSONA = compact_prompt("""
 I am Gideon, a friendly and knowledgeable Godot game engine tutor.
 
 My role is to help Mark learn game engine internals through his tic-tac-toe project.
@@ -414,9 +107,13 @@ I have access to:
 - The ability to add resources, code examples, and lessons
 
 I share memory with the Curator agent who handles background curation.
-"""
+When I need the big picture, get_curation_snapshot returns topics, conversations,
+progress, and added content in one call instead of four separate lookups.
+Some tools return lists as {"columns": [...], "rows": [[...], ...]} to save space;
+each row holds one item's values in column order.
+""")
 
-CURATOR_PERSONA = """
+CURATOR_PERSONA = compact_prompt("""
 I am the Curator agent - a background processor for the Godot Learning App.
 
 My role is to analyze Mark's learning journey and proactively curate content:
@@ -429,7 +126,11 @@ My role is to analyze Mark's learning journey and proactively curate content:
 I work in the background (sleeptime) and through direct triggers:
 - When Mark visits a topic, I check if he needs more resources
 - After conversations, I analyze what he asked and may create lessons
+- I start each pass with get_curation_snapshot (topics, conversations, progress,
+  and existing content in one call), or fetch_context_bundle for specific topics
 - I track what's already been added to avoid duplicates
+- I collect all resources in one list and call add_resources_bulk once at the end
+  (and add_code_examples_bulk for code examples) instead of adding items one by one
 
 My curation philosophy:
 - Quality over quantity - only add truly helpful content
@@ -438,9 +139,14 @@ My curation philosophy:
 - Connected - show how concepts relate to each other
 
 I share memory with Gideon (the chat agent) so we stay coordinated.
-"""
-
-HUMAN_CONTEXT = """
+learning_progress is only a short summary. Detailed observations go to upsert_memory,
+and I recall them with search_memory when they're relevant. When learning_progress
+grows large, I rewrite it as a compact summary and save it with compress_memory.
+Some tools return lists as {"columns": [...], "rows": [[...], ...]} to save space;
+each row holds one item's values in column order.
+""")
+
+HUMAN_CONTEXT = compact_prompt("""
 Name: Mark
 Background: Experienced Python developer, new to game development
 Current project: Building a tic-tac-toe game in Godot to learn engine internals
@@ -456,19 +162,7 @@ Current curriculum topics:
 - gdscript-internals: GDScript Internals (internals)
 - composition: Composition Over Inheritance (patterns)
 - state-machines: State Machines (patterns)
-"""
-
-
-def create_tool_from_source(client, func, app_url: str):
-    """Create a Letta tool from a factory function with embedded URL."""
-    inner_func = func(app_url)
-    source = inspect.getsource(inner_func)
-    lines = source.split('\n')
-    min_indent = min(len(line) - len(line.lstrip()) for line in lines if line.strip())
-    source = '\n'.join(line[min_indent:] if line.strip() else '' for line in lines)
-    source = source.replace('{app_url}', app_url)
-    tool = client.tools.create(source_code=source)
-    return tool
+""")
 
 
 def create_agents():
@@ -485,42 +179,71 @@ def create_agents():
     learning_progress_block = client.blocks.create(
         label="learning_progress",
         description="Tracks Mark's learning journey - topics studied, gaps identified, patterns observed",
-        value="No learning sessions analyzed yet. Use get_recent_conversations to see student activity."
+        value="No learning sessions analyzed yet. Use get_curation_snapshot to see student activity.",
+        limit=500  # Short summary only - details live in search_memory/upsert_memory
     )
     print(f"  Created: learning_progress (id: {learning_progress_block.id})")
 
     curated_content_block = client.blocks.create(
         label="curated_content",
         description="Tracks what resources, examples, and lessons have been added",
-        value="No content curated yet. Use get_current_extensions to see what has been added."
+        value="No content curated yet. Use get_curation_snapshot to see what has been added."
     )
     print(f"  Created: curated_content (id: {curated_content_block.id})")
 
+    # Mark's context is identical for both agents, so they share one block;
+    # either agent can record new facts about him in it
+    human_block = client.blocks.create(
+        label="human",
+        description="Shared human context",
+        value=HUMAN_CONTEXT,
+        limit=2000
+    )
+    print(f"  Created: human (id: {human_block.id})")
+
+    # Gideon's rolling window of recent turns - rewritten every turn, so it is
+    # attached last to keep the cacheable system-prompt prefix stable
+    working_memory_block = client.blocks.create(
+        label="working_memory",
+        description="The last few conversation turns (sliding window)",
+        value="No recent conversation turns yet.",
+        limit=1500
+    )
+    print(f"  Created: working_memory (id: {working_memory_block.id})")
+
     # =========================================================================
     # Create Tools (using runtime env var - no hardcoded URLs)
     # =========================================================================
     print("\nCreating custom tools...")
     print(f"  Tools will read LEARNING_APP_URL from environment at runtime")
 
-    from tools import ALL_TOOLS
+    def upsert_tool(func):
+        try:
+            # Upsert so re-running setup updates the existing tool instead of duplicating it
+            return client.tools.upsert(
+                source_code=tools.tool_source(func),
+                enable_parallel_execution=func in tools.READ_ONLY_TOOLS
+            )
+        except Exception as e:
+            return e
+
+    # Each upsert is an independent round-trip to the Letta server, so send
+    # them concurrently; map() keeps results in ALL_TOOLS order
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(upsert_tool, tools.ALL_TOOLS))
 
     gideon_tools = []
     curator_tools = []
 
-    for func in ALL_TOOLS:
-        try:
-            # Get source code and dedent it
-            source = inspect.getsource(func)
-            lines = source.split('\n')
-            min_indent = min(len(line) - len(line.lstrip()) for line in lines if line.strip())
-            source = '\n'.join(line[min_indent:] if line.strip() else '' for line in lines)
-
-            tool = client.tools.create(source_code=source)
-            gideon_tools.append(tool.name)
+    for func, tool in zip(tools.ALL_TOOLS, results):
+        if isinstance(tool, Exception):
+            print(f"  Failed to create tool {func.__name__}: {tool}")
+            continue
+        gideon_tools.append(tool.name)
+        # The Curator reads everything through get_curation_snapshot instead
+        if func not in tools.SNAPSHOT_TOOLS:
             curator_tools.append(tool.name)
-            print(f"  Created tool: {tool.name}")
-        except Exception as e:
-            print(f"  Failed to create tool {func.__name__}: {e}")
+        print(f"  Created tool: {tool.name}")
 
     # =========================================================================
     # Create Gideon (Chat Agent)
@@ -530,14 +253,17 @@ def create_agents():
     gideon = client.agents.create(
         name="gideon-tutor",
         model="anthropic/claude-sonnet-4-20250514",
+        model_settings={"provider_type": "anthropic", "parallel_tool_calls": True},
         embedding="letta/letta-free",
         context_window_limit=16000,
         enable_sleeptime=True,  # Enable background processing
+        # Rarely-edited blocks first so the provider's prompt cache can reuse
+        # that prefix; shared and per-turn blocks follow. They stay writable -
+        # an agent's own persona edit only costs one cache miss
         memory_blocks=[
-            {"label": "persona", "value": GIDEON_PERSONA, "limit": 4000},
-            {"label": "human", "value": HUMAN_CONTEXT, "limit": 2000}
+            {"label": "persona", "value": GIDEON_PERSONA, "limit": 4000}
         ],
-        block_ids=[learning_progress_block.id, curated_content_block.id],
+        block_ids=[human_block.id, learning_progress_block.id, curated_content_block.id, working_memory_block.id],
         tools=gideon_tools + ["web_search"],
         description="Gideon - Friendly Godot tutor for real-time learning conversations"
     )
@@ -570,13 +296,13 @@ def create_agents():
     curator = client.agents.create(
         name="curator-agent",
         model="anthropic/claude-sonnet-4-20250514",
+        model_settings={"provider_type": "anthropic", "parallel_tool_calls": True},
         embedding="letta/letta-free",
         context_window_limit=16000,
         memory_blocks=[
-            {"label": "persona", "value": CURATOR_PERSONA, "limit": 4000},
-            {"label": "human", "value": HUMAN_CONTEXT, "limit": 2000}
+            {"label": "persona", "value": CURATOR_PERSONA, "limit": 4000}
         ],
-        block_ids=[learning_progress_block.id, curated_content_block.id],
+        block_ids=[human_block.id, learning_progress_block.id, curated_content_block.id],
         tools=curator_tools + ["web_search"],
         description="Curator - Manual curation agent for triggered content generation"
     )
@@ -593,20 +319,23 @@ def create_agents():
         "curator": curator.id,
         "sleeptime": sleeptime_agent_id,
         "shared_blocks": {
+            "human": human_block.id,
             "learning_progress": learning_progress_block.id,
             "curated_content": curated_content_block.id
         }
     }
 
     agent_file = os.path.join(os.path.dirname(__file__), "agent_ids.json")
-    with open(agent_file, "w") as f:
-        json.dump(agent_ids, f, indent=2)
+    if orjson:
+        data = orjson.dumps(agent_ids, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(agent_ids, indent=2).encode()
+    write_atomic(agent_file, data)
     print(f"\nAgent IDs saved to: {agent_file}")
 
     # Also save gideon ID to agent_id.txt for backward compatibility
     gideon_file = os.path.join(os.path.dirname(__file__), "agent_id.txt")
-    with open(gideon_file, "w") as f:
-        f.write(gideon.id)
+    write_atomic(gideon_file, gideon.id.encode())
     print(f"Gideon ID saved to: {gideon_file}")
 
     return gideon, curator, sleeptime_agent_id
@@ -633,6 +362,27 @@ def test_agent(agent_id: str, name: str):
                 print(f"  [Tool call: {tc.function.name}]")
 
 
+# Status of each URL that has answered _check with a 2xx. Failures aren't kept,
+# so a server that was down a moment ago is seen once it's up
+_CHECKED = {}
+
+
+def _check(url: str) -> int:
+    """
+    Return the status code of a HEAD to url through SESSION, falling back to
+    GET when the server doesn't route HEAD (405). Successes are cached.
+    """
+    if url in _CHECKED:
+        return _CHECKED[url]
+    response = SESSION.head(url, timeout=2, allow_redirects=True)
+    if response.status_code == 405:
+        # A full GET, not a streamed one, so the connection goes back to the pool
+        response = SESSION.get(url, timeout=2)
+    if 200 <= response.status_code < 300:
+        _CHECKED[url] = response.status_code
+    return response.status_code
+
+
 def main():
     print("=" * 60)
     print("Godot Learning App - Multi-Agent Setup")
@@ -641,13 +391,13 @@ def main():
     # Check if Letta server is running
     print("\nChecking Letta server...")
     try:
-        response = requests.get(f"{LETTA_BASE_URL}/v1/health", timeout=5)
-        if response.ok:
+        status = _check(f"{LETTA_BASE_URL}/v1/health")
+        if 200 <= status < 300:
             print(f"Letta server is running at {LETTA_BASE_URL}")
         else:
-            print(f"Letta server returned {response.status_code}")
+            print(f"Letta server returned {status}")
             exit(1)
-    except Exception as e:
+    except requests.RequestException as e:
         print(f"Cannot reach Letta server: {e}")
         print("\nStart the server first:")
         print("  source .venv/bin/activate")
@@ -657,12 +407,12 @@ def main():
     # Check if learning app is running
     print("\nChecking learning app...")
     try:
-        response = requests.get(f"{LEARNING_APP_URL}/api/letta", timeout=5)
-        if response.ok:
+        status = _check(f"{LEARNING_APP_URL}/api/letta")
+        if 200 <= status < 300:
             print(f"Learning app is running at {LEARNING_APP_URL}")
         else:
-            print(f"Learning app returned {response.status_code}")
-    except Exception as e:
+            print(f"Learning app returned {status}")
+    except requests.RequestException as e:
         print(f"Cannot reach learning app: {e}")
         print(f"  Make sure your app is running at {LEARNING_APP_URL}")
         print("  Continuing anyway - tools will work once app is running...")
@@ -0,0 +1,104 @@
+"""
+Fixtures for the Letta tool tests: a stub learning app on a local port and a
+throwaway HOME, so the tools' disk caches and memory store start empty.
+"""
+
+import hashlib
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+# The scripts import each other as top-level modules (python letta/setup_agents.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class StubApp:
+    """Canned learning-app responses, plus a log of every request that reached it."""
+
+    def __init__(self):
+        self.requests = []
+        self.fail_status = None
+        self.extensions = {
+            "extensions": {"signals": {"topicId": "signals", "resources": [], "codeExamples": []}}
+        }
+        self.progress = {"topics": {"signals": {"notes": "Confused by connect()"}}}
+
+    def hits(self, method: str, path: str) -> list:
+        """The logged requests with method whose path (query included) starts with path."""
+        return [r for r in self.requests if r["method"] == method and r["path"].startswith(path)]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status: int, data=None, headers: dict = None):
+        body = b"" if data is None else json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        app = self.server.app
+        app.requests.append({"method": "GET", "path": self.path, "headers": dict(self.headers)})
+        if app.fail_status:
+            return self._send(app.fail_status, {"error": "stub failure"})
+
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path == "/api/letta":
+            action = query.get("action")
+            if action == "extensions":
+                # Same scheme as jsonWithETag: a content hash, matched weakly
+                etag = f'"{hashlib.sha1(json.dumps(app.extensions).encode()).hexdigest()}"'
+                if self.headers.get("If-None-Match", "").replace("W/", "") == etag:
+                    return self._send(304, headers={"ETag": etag})
+                return self._send(200, app.extensions, {"ETag": etag})
+            if action == "notebook":
+                return self._send(200, {"notebook": {"topicId": query["topicId"], "messages": []}})
+            return self._send(200, {"action": action, "format": query.get("format")})
+        if url.path == "/api/progress":
+            return self._send(200, app.progress)
+        if url.path == "/api/letta/lessons":
+            return self._send(200, {"lessons": [], "topicId": query.get("topicId")})
+        self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        app = self.server.app
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        app.requests.append({"method": "POST", "path": self.path, "body": body})
+        if app.fail_status:
+            return self._send(app.fail_status, {"error": "stub failure"})
+        self._send(200, {"success": True})
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    """Point HOME at a temp dir so every test gets empty caches."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def app(monkeypatch):
+    """Serve a StubApp on a free port and point LEARNING_APP_URL at it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.app = StubApp()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    monkeypatch.setenv("LEARNING_APP_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    yield server.app
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,307 @@
+"""Tests for the Letta tools in tools.py, run in-process and as uploaded source."""
+
+import ast
+import json
+import os
+import sqlite3
+import time
+
+import pytest
+
+import _tool_runtime
+import tools
+
+
+def cache_files(home, kind: str) -> list:
+    cache_dir = home / ".cache" / "letta_agent_ttl"
+    return sorted(cache_dir.glob(f"{kind}-*.json")) if cache_dir.exists() else []
+
+
+# =============================================================================
+# TTL cache (cached_get / clear_cache)
+# =============================================================================
+
+def test_repeat_calls_are_served_from_the_cache(app):
+    first = tools.get_topics()
+    second = tools.get_topics()
+
+    assert first == second
+    assert len(app.hits("GET", "/api/letta?action=topics")) == 1
+
+
+def test_expired_entries_are_fetched_again(app, home):
+    tools.get_topics()
+    (entry,) = cache_files(home, "topics")
+    stale = time.time() - _tool_runtime.CACHE_TTL_S["topics"] - 1
+    os.utime(entry, (stale, stale))
+
+    tools.get_topics()
+
+    assert len(app.hits("GET", "/api/letta?action=topics")) == 2
+
+
+def test_progress_and_notes_share_one_cache_entry(app):
+    tools.get_student_progress()
+    notes = json.loads(tools.get_student_notes("signals"))
+    bulk = json.loads(tools.get_student_notes_bulk('["signals", "game-loop"]'))
+
+    assert notes == {"topicId": "signals", "notes": "Confused by connect()", "hasNotes": True}
+    assert bulk == {"signals": "Confused by connect()", "game-loop": ""}
+    assert len(app.hits("GET", "/api/progress")) == 1
+
+
+def test_entries_are_cached_per_url(app):
+    tools.get_lessons("signals")
+    tools.get_lessons("game-loop")
+    tools.get_lessons("signals")
+
+    assert len(app.hits("GET", "/api/letta/lessons")) == 2
+
+
+def test_add_lesson_clears_only_the_lessons_cache(app, home):
+    tools.get_topics()
+    tools.get_lessons("signals")
+    tools.get_lessons()
+    assert len(cache_files(home, "lessons")) == 2
+
+    result = tools.add_lesson(
+        "signals", "Connecting signals", "beginner", "Why", '["a"]', "Body", '["b"]', '["c"]', "test"
+    )
+    assert json.loads(result) == {"success": True}
+    assert cache_files(home, "lessons") == []
+    assert len(cache_files(home, "topics")) == 1
+
+    tools.get_lessons("signals")
+    assert len(app.hits("GET", "/api/letta/lessons?format=columnar&topicId=signals")) == 2
+
+
+def test_errors_are_reported_and_not_cached(app):
+    app.fail_status = 500
+    error = json.loads(tools.get_topics())
+    assert error["error"]["status"] == 500
+    assert error["error"]["message"].startswith("Learning app returned 500")
+
+    app.fail_status = None
+    assert json.loads(tools.get_topics()) == {"action": "topics", "format": None}
+    assert len(app.hits("GET", "/api/letta?action=topics")) == 2
+
+
+def test_unreachable_app_is_reported_as_error_json(monkeypatch):
+    monkeypatch.setenv("LEARNING_APP_URL", "http://127.0.0.1:9")
+
+    error = json.loads(tools.get_topics())
+
+    assert error["error"]["message"].startswith("Cannot reach the learning app")
+    assert "status" not in error["error"]
+
+
+# =============================================================================
+# ETag cache (etag_get)
+# =============================================================================
+
+def etag_cache_file(home):
+    return home / ".cache" / "letta_agent_etags.json"
+
+
+def extensions_url():
+    return f"{os.environ['LEARNING_APP_URL']}/api/letta?action=extensions&format=columnar"
+
+
+def test_unchanged_extensions_come_back_as_304(app):
+    first = tools.get_current_extensions()
+    second = tools.get_current_extensions()
+
+    assert json.loads(second) == app.extensions
+    assert second == first
+    conditional = app.hits("GET", "/api/letta?action=extensions")[1]
+    assert conditional["headers"]["If-None-Match"].startswith('"')
+
+
+def test_changed_extensions_replace_the_cached_body(app):
+    tools.get_current_extensions()
+    app.extensions = {"extensions": {}}
+
+    assert json.loads(tools.get_current_extensions()) == {"extensions": {}}
+    assert json.loads(tools.get_current_extensions()) == {"extensions": {}}
+
+
+def test_etag_cache_is_written_atomically(app, home, monkeypatch):
+    tools.get_current_extensions()
+    saved = etag_cache_file(home).read_bytes()
+    assert list(json.loads(saved)) == [extensions_url()]
+    # Nothing left behind from the temp file + rename
+    assert sorted(p.name for p in etag_cache_file(home).parent.iterdir()) == ["letta_agent_etags.json"]
+
+    # A write that fails before the rename leaves the previous cache intact
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(_tool_runtime.os, "replace", fail_replace)
+    app.extensions = {"extensions": {}}
+    assert json.loads(tools.get_current_extensions()) == {"extensions": {}}
+    assert etag_cache_file(home).read_bytes() == saved
+
+
+@pytest.mark.parametrize("contents", [
+    b"not json",
+    b"[1, 2]",
+    b'{"URL": 5}',
+    b'{"URL": ["only-an-etag"]}',
+])
+def test_corrupt_etag_cache_falls_back_to_a_full_fetch(app, home, contents):
+    cache_file = etag_cache_file(home)
+    cache_file.parent.mkdir(parents=True)
+    cache_file.write_bytes(contents.replace(b"URL", extensions_url().encode()))
+
+    assert json.loads(tools.get_current_extensions()) == app.extensions
+
+    (request,) = app.hits("GET", "/api/letta?action=extensions")
+    assert "If-None-Match" not in request["headers"]
+    assert extensions_url() in json.loads(cache_file.read_bytes())
+
+
+def test_context_bundle_uses_the_columnar_extensions_cache(app):
+    tools.get_current_extensions()
+
+    bundle = json.loads(tools.fetch_context_bundle('["signals"]'))
+
+    assert bundle["extensions"] == app.extensions["extensions"]
+    assert bundle["notebooks"] == {"signals": {"topicId": "signals", "messages": []}}
+    paths = [r["path"] for r in app.hits("GET", "/api/letta?action=extensions")]
+    assert paths == ["/api/letta?action=extensions&format=columnar"] * 2
+
+
+# =============================================================================
+# Long-term memory (upsert_memory / search_memory)
+# =============================================================================
+
+def memory_db(home):
+    return home / ".cache" / "letta_agent_memory.db"
+
+
+def memory_schema(home) -> str:
+    with sqlite3.connect(memory_db(home)) as db:
+        return db.execute("SELECT sql FROM sqlite_master WHERE name = 'memories'").fetchone()[0]
+
+
+def check_upsert_and_search():
+    assert json.loads(tools.upsert_memory("signals", "Struggles with signal connect syntax")) == {
+        "saved": True, "topicId": "signals"
+    }
+    assert json.loads(tools.upsert_memory("signals", "Struggles with signal connect syntax"))["saved"] is False
+    tools.upsert_memory("game-loop", "Understands delta time")
+
+    (match,) = json.loads(tools.search_memory("connect"))
+    assert match["topic_id"] == "signals"
+    assert match["note"] == "Struggles with signal connect syntax"
+    assert len(json.loads(tools.search_memory("connect delta"))) == 2
+    assert len(json.loads(tools.search_memory("connect delta", limit=1))) == 1
+    assert json.loads(tools.search_memory("physics")) == []
+
+
+def test_memory_round_trip_with_fts5(home):
+    check_upsert_and_search()
+    assert "fts5" in memory_schema(home).lower()
+
+
+def test_memory_falls_back_to_like_without_fts5(home, monkeypatch):
+    real_connect = sqlite3.connect
+
+    class NoFTS5(sqlite3.Connection):
+        """A connection that acts like SQLite built without the FTS5 module."""
+        def execute(self, sql, *args):
+            if "fts5" in sql.lower():
+                raise sqlite3.OperationalError("no such module: fts5")
+            return super().execute(sql, *args)
+
+    monkeypatch.setattr(sqlite3, "connect", lambda path: real_connect(path, factory=NoFTS5))
+
+    check_upsert_and_search()
+    assert "fts5" not in memory_schema(home).lower()
+
+
+def test_search_memory_without_a_store_or_words(home):
+    assert tools.search_memory("anything") == "[]"
+    tools.upsert_memory("signals", "A note")
+    assert tools.search_memory("?!") == "[]"
+
+
+# =============================================================================
+# Bulk and lesson input validation
+# =============================================================================
+
+@pytest.mark.parametrize("tool", [tools.add_resources_bulk, tools.add_code_examples_bulk])
+@pytest.mark.parametrize("items, message", [
+    ("[{", "items must be a JSON array:"),
+    ('{"topic_id": "signals"}', "items must be a JSON array of objects"),
+    ('[{"topic_id": "signals"}, "not an object"]', "items must be a JSON array of objects"),
+])
+def test_bulk_tools_reject_malformed_items_before_posting(app, tool, items, message):
+    error = json.loads(tool(items))
+
+    assert error["error"]["message"].startswith(message)
+    assert app.hits("POST", "/") == []
+
+
+def test_add_resources_bulk_posts_camel_case_items(app):
+    items = [{"topic_id": "signals", "title": "Signals", "url": "https://docs.godotengine.org", "type": "docs"}]
+
+    assert json.loads(tools.add_resources_bulk(json.dumps(items))) == {"success": True}
+
+    (request,) = app.hits("POST", "/api/letta")
+    assert request["body"] == {
+        "action": "add_resources_bulk",
+        "items": [{"topicId": "signals", "title": "Signals", "url": "https://docs.godotengine.org", "type": "docs"}]
+    }
+
+
+def test_add_code_examples_bulk_posts_camel_case_items(app):
+    items = [{"topic_id": "signals", "title": "Connect", "language": "gdscript", "code": "a.connect(b)",
+              "explanation": "Wires a to b"}]
+
+    tools.add_code_examples_bulk(items)
+
+    (request,) = app.hits("POST", "/api/letta")
+    assert request["body"]["action"] == "add_code_examples_bulk"
+    assert request["body"]["items"][0]["topicId"] == "signals"
+
+
+def test_add_lesson_rejects_non_array_fields(app):
+    error = json.loads(tools.add_lesson(
+        "signals", "Title", "beginner", "Why", '"not a list"', "Body", "[]", "[]", "test"
+    ))
+
+    assert error["error"]["message"].startswith("concepts, exercises, and connections must be JSON arrays")
+    assert app.hits("POST", "/") == []
+
+
+def test_notes_bulk_rejects_non_string_ids(app):
+    error = json.loads(tools.get_student_notes_bulk("[1, 2]"))
+
+    assert error == {"error": {"message": "topic_ids must be a JSON array of topic ID strings"}}
+    assert app.requests == []
+
+
+# =============================================================================
+# Uploaded source (tool_source)
+# =============================================================================
+
+@pytest.mark.parametrize("func", tools.ALL_TOOLS, ids=lambda func: func.__name__)
+def test_letta_finds_the_tool_in_its_uploaded_source(func):
+    # Letta takes the last function definition in ast.walk order as the tool
+    source = tools.tool_source(func)
+    defs = [node for node in ast.walk(ast.parse(source)) if isinstance(node, ast.FunctionDef)]
+
+    assert defs[-1].name == func.__name__
+
+
+def test_uploaded_source_runs_without_the_package(app, home):
+    namespace = {}
+    exec(compile(tools.tool_source(tools.get_student_notes), "<tool>", "exec"), namespace)
+
+    notes = json.loads(namespace["get_student_notes"]("signals"))
+
+    assert notes["notes"] == "Confused by connect()"
+    # The uploaded copy fills the same disk cache as in-process calls
+    tools.get_student_progress()
+    assert len(app.hits("GET", "/api/progress")) == 1
@@ -2,9 +2,29 @@
 Letta tool definitions for the Godot Learning App.
 All tools read LEARNING_APP_URL from environment at runtime - no hardcoded URLs.
 
-Each function must be self-contained with imports inside.
+Each function must be self-contained apart from the shared runtime in
+_tool_runtime.py: tool_source() prepends that file to every uploaded tool,
+and in-process calls use the names imported below.
+They are synchronous on purpose - READ_ONLY_TOOLS are registered for parallel
+execution, and fetch_context_bundle covers multi-topic reads with threads.
 """
 
+import inspect
+from textwrap import dedent
+import _tool_runtime
+from _tool_runtime import (
+    ToolError, app_get, app_post, cached_get, clear_cache, etag_get, json_loads, json_text, tool_error
+)
+
+# Prepended to every uploaded tool, since the tool can't import this package there
+RUNTIME_SOURCE = inspect.getsource(_tool_runtime)
+
+
+def tool_source(func) -> str:
+    """Return the source uploaded to Letta for func: the shared runtime, then the tool."""
+    return f"{RUNTIME_SOURCE}\n\n{dedent(inspect.getsource(func))}"
+
+
 def get_topics() -> str:
     """
     Get all available topics in the Godot learning curriculum.
@@ -15,17 +35,12 @@ def get_topics() -> str:
         str: JSON string of topics with id, title, category, and description
     """
     import os
-    import json
-    import requests
 
     app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
     try:
-        response = requests.get(f"{app_url}/api/letta?action=topics")
-        if response.ok:
-            return json.dumps(response.json(), indent=2)
-        return f"Error: {response.status_code}"
-    except Exception as e:
-        return f"Error connecting to learning app at {app_url}: {e}"
+        return cached_get("topics", f"{app_url}/api/letta?action=topics")
+    except ToolError as e:
+        return tool_error(*e.args)
 
 
 def get_recent_conversations() -> str:
@@ -38,23 +53,19 @@ def get_recent_conversations() -> str:
         str: JSON string of notebooks with topic_id, title, message_count, last_updated
     """
     import os
-    import json
-    import requests
 
     app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
     try:
-        response = requests.get(f"{app_url}/api/letta?action=notebooks")
-        if response.ok:
-            return json.dumps(response.json(), indent=2)
-        return f"Error: {response.status_code}"
-    except Exception as e:
-        return f"Error connecting to learning app at {app_url}: {e}"
+        return cached_get("notebooks", f"{app_url}/api/letta?action=notebooks&format=columnar")
+    except ToolError as e:
+        return tool_error(*e.args)
 
 
 def get_conversation_details(topic_id: str) -> str:
     """
     Get the full conversation history for a specific topic.
     Use this to analyze what questions the student asked and what they're struggling with.
+    For several topics, call fetch_context_bundle once instead.
 
     Args:
         topic_id: The ID of the topic (e.g., 'game-loop', 'signals', 'scene-tree')
@@ -63,17 +74,13 @@ def get_conversation_details(topic_id: str) -> str:
         str: JSON string of conversation messages for that topic
     """
     import os
-    import json
-    import requests
+    from urllib.parse import quote
 
     app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
     try:
-        response = requests.get(f"{app_url}/api/letta?action=notebook&topicId={topic_id}")
-        if response.ok:
-            return json.dumps(response.json(), indent=2)
-        return f"Error: {response.status_code}"
-    except Exception as e:
-        return f"Error connecting to learning app at {app_url}: {e}"
+        return cached_get("notebook", f"{app_url}/api/letta?action=notebook&topicId={quote(topic_id, safe='')}")
+    except ToolError as e:
+        return tool_error(*e.args)
 
 
 def get_current_extensions() -> str:
@@ -85,17 +92,12 @@ def get_current_extensions() -> str:
         str: JSON string of all dynamically added resources and code examples
     """
     import os
-    import json
-    import requests
 
     app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
     try:
-        response = requests.get(f"{app_url}/api/letta?action=extensions")
-        if response.ok:
-            return json.dumps(response.json(), indent=2)
-        return f"Error: {response.status_code}"
-    except Exception as e:
-        return f"Error connecting to learning app at {app_url}: {e}"
+        return etag_get(f"{app_url}/api/letta?action=extensions&format=columnar")
+    except ToolError as e:
+        return tool_error(*e.args)
 
 
 def get_student_progress() -> str:
@@ -108,17 +110,12 @@ def get_student_progress() -> str:
         str: JSON string of progress data per topic
     """
     import os
-    import json
-    import requests
 
     app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
     try:
-        response = requests.get(f"{app_url}/api/progress")
-        if response.ok:
-            return json.dumps(response.json(), indent=2)
-        return f"Error: {response.status_code}"
-    except Exception as e:
-        return f"Error connecting to learning app at {app_url}: {e}"
+        return cached_get("progress", f"{app_url}/api/progress")
+    except ToolError as e:
+        return tool_error(*e.args)
 
 
 def get_student_notes(topic_id: str) -> str:
@@ -126,6 +123,7 @@ def get_student_notes(topic_id: str) -> str:
     Get the student's personal notes for a specific topic.
     Notes contain the student's own insights, questions, and reflections.
     Use this to understand what the student found important or confusing.
+    For several topics, call get_student_notes_bulk once instead.
 
     Args:
         topic_id: The ID of the topic (e.g., 'game-loop', 'signals', 'scene-tree')
@@ -134,24 +132,136 @@ def get_student_notes(topic_id: str) -> str:
         str: The student's notes for that topic, or empty if none
     """
     import os
-    import json
-    import requests
 
     app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
     try:
-        response = requests.get(f"{app_url}/api/progress")
-        if response.ok:
-            data = response.json()
-            topic_progress = data.get('topics', {}).get(topic_id, {})
-            notes = topic_progress.get('notes', '')
-            return json.dumps({
-                'topicId': topic_id,
-                'notes': notes,
-                'hasNotes': bool(notes.strip()) if notes else False
-            }, indent=2)
-        return f"Error: {response.status_code}"
-    except Exception as e:
-        return f"Error connecting to learning app at {app_url}: {e}"
+        # Notes come from the same /api/progress payload as get_student_progress,
+        # so they share its cache entry
+        data = json_loads(cached_get("progress", f"{app_url}/api/progress"))
+        topic_progress = data.get('topics', {}).get(topic_id, {})
+        notes = topic_progress.get('notes', '')
+        return json_text({
+            'topicId': topic_id,
+            'notes': notes,
+            'hasNotes': bool(notes.strip()) if notes else False
+        })
+    except ToolError as e:
+        return tool_error(*e.args)
+    except ValueError as e:
+        return tool_error(f"Learning app returned invalid JSON: {e}")
+
+
+def get_student_notes_bulk(topic_ids: str) -> str:
+    """
+    Get the student's personal notes for several topics in one call.
+    Use this instead of calling get_student_notes once per topic.
+
+    Args:
+        topic_ids: JSON array of topic IDs (e.g., '["game-loop", "signals"]')
+
+    Returns:
+        str: JSON object mapping each topic ID to its notes, or empty if none
+    """
+    import os
+
+    app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
+    try:
+        ids = json_loads(topic_ids) if isinstance(topic_ids, str) else topic_ids
+    except ValueError as e:
+        return tool_error(f"topic_ids must be a JSON array: {e}")
+    if not isinstance(ids, list) or not all(isinstance(topic_id, str) for topic_id in ids):
+        return tool_error("topic_ids must be a JSON array of topic ID strings")
+
+    try:
+        # Shares get_student_progress's cache entry, like get_student_notes
+        topics = json_loads(cached_get("progress", f"{app_url}/api/progress")).get('topics', {})
+        return json_text({
+            topic_id: topics.get(topic_id, {}).get('notes', '')
+            for topic_id in ids
+        })
+    except ToolError as e:
+        return tool_error(*e.args)
+    except ValueError as e:
+        return tool_error(f"Learning app returned invalid JSON: {e}")
+
+
+def get_curation_snapshot() -> str:
+    """
+    Get an overview for a curation pass in a single call: curriculum topics,
+    each notebook's latest messages, student progress, and the titles of the
+    resources/code examples already added. Long text is truncated, marked with
+    "[... more chars truncated]", and older messages are counted in omittedMessages.
+    Call this once at the start of curation instead of the individual get_* tools,
+    then fetch_context_bundle for the full detail of the topics you pick.
+
+    Returns:
+        str: JSON string with topics, notebooks, progress, and extensions
+    """
+    import os
+
+    app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
+    try:
+        return app_get(f"{app_url}/api/letta?action=snapshot&format=columnar")
+    except ToolError as e:
+        return tool_error(*e.args)
+
+
+def fetch_context_bundle(topic_ids: str) -> str:
+    """
+    Fetch conversations, notes/progress, and existing extensions for several topics at once.
+    The requests run in parallel, so this is much faster than calling
+    get_conversation_details and get_current_extensions one topic at a time.
+
+    Args:
+        topic_ids: JSON array of topic IDs (e.g., '["game-loop", "signals"]')
+
+    Returns:
+        str: JSON string with notebooks per topic, progress, and those topics' extensions
+    """
+    import os
+    from urllib.parse import quote
+    from concurrent.futures import ThreadPoolExecutor
+
+    app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
+    try:
+        ids = json_loads(topic_ids) if isinstance(topic_ids, str) else topic_ids
+    except ValueError as e:
+        return tool_error(f"topic_ids must be a JSON array: {e}")
+    if not isinstance(ids, list) or not all(isinstance(topic_id, str) for topic_id in ids):
+        return tool_error("topic_ids must be a JSON array of topic ID strings")
+
+    try:
+        # (cache kind, URL) per request: the same URLs and caches as the
+        # single-topic tools, so their responses serve each other. Extensions
+        # (kind None) go through the ETag cache, like get_current_extensions
+        sources = {
+            "extensions": (None, f"{app_url}/api/letta?action=extensions&format=columnar"),
+            "progress": ("progress", f"{app_url}/api/progress"),
+        }
+        for topic_id in ids:
+            sources[("notebook", topic_id)] = (
+                "notebook", f"{app_url}/api/letta?action=notebook&topicId={quote(topic_id, safe='')}"
+            )
+
+        with ThreadPoolExecutor(max_workers=min(len(sources), 16)) as pool:
+            results = dict(zip(sources, pool.map(
+                lambda source: json_loads(cached_get(*source) if source[0] else etag_get(source[1])),
+                sources.values()
+            )))
+        extensions = results["extensions"].get("extensions", {})
+
+        return json_text({
+            "notebooks": {topic_id: results[("notebook", topic_id)].get("notebook") for topic_id in ids},
+            "progress": results["progress"],
+            # Just the requested topics, so a narrow bundle stays small
+            "extensions": {
+                topic_id: extensions[topic_id] for topic_id in ids if topic_id in extensions
+            }
+        })
+    except ToolError as e:
+        return tool_error(*e.args)
+    except ValueError as e:
+        return tool_error(f"Learning app returned invalid JSON: {e}")
 
 
 def add_resource(topic_id: str, title: str, url: str, resource_type: str) -> str:
@@ -169,26 +279,18 @@ def add_resource(topic_id: str, title: str, url: str, resource_type: str) -> str
         str: JSON confirmation of the added resource
     """
     import os
-    import json
-    import requests
 
     app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
     try:
-        response = requests.post(
-            f"{app_url}/api/letta",
-            json={
-                "action": "add_resource",
-                "topicId": topic_id,
-                "title": title,
-                "url": url,
-                "type": resource_type
-            }
-        )
-        if response.ok:
-            return json.dumps(response.json(), indent=2)
-        return f"Error: {response.status_code} - {response.text}"
-    except Exception as e:
-        return f"Error connecting to learning app at {app_url}: {e}"
+        return app_post(f"{app_url}/api/letta", {
+            "action": "add_resource",
+            "topicId": topic_id,
+            "title": title,
+            "url": url,
+            "type": resource_type
+        })
+    except ToolError as e:
+        return tool_error(*e.args)
 
 
 def add_code_example(topic_id: str, title: str, language: str, code: str, explanation: str) -> str:
@@ -207,27 +309,96 @@ def add_code_example(topic_id: str, title: str, language: str, code: str, explan
         str: JSON confirmation of the added code example
     """
     import os
-    import json
-    import requests
 
     app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
     try:
-        response = requests.post(
-            f"{app_url}/api/letta",
-            json={
-                "action": "add_code_example",
-                "topicId": topic_id,
-                "title": title,
-                "language": language,
-                "code": code,
-                "explanation": explanation
-            }
-        )
-        if response.ok:
-            return json.dumps(response.json(), indent=2)
-        return f"Error: {response.status_code} - {response.text}"
-    except Exception as e:
-        return f"Error connecting to learning app at {app_url}: {e}"
+        return app_post(f"{app_url}/api/letta", {
+            "action": "add_code_example",
+            "topicId": topic_id,
+            "title": title,
+            "language": language,
+            "code": code,
+            "explanation": explanation
+        })
+    except ToolError as e:
+        return tool_error(*e.args)
+
+
+def add_resources_bulk(items: str) -> str:
+    """
+    Add several learning resources in one call. Prefer this over repeated add_resource
+    calls: collect all the resources you want to add, then call this once at the end.
+
+    Args:
+        items: JSON array of resources, each with topic_id, title, url, and type
+            (one of 'docs', 'source', 'book', 'video'), e.g.
+            '[{"topic_id": "signals", "title": "...", "url": "...", "type": "docs"}]'
+
+    Returns:
+        str: JSON summary of how many resources were added and any per-item errors
+    """
+    import os
+
+    app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
+    try:
+        items_list = json_loads(items) if isinstance(items, str) else items
+    except ValueError as e:
+        return tool_error(f"items must be a JSON array: {e}")
+    if not isinstance(items_list, list) or not all(isinstance(item, dict) for item in items_list):
+        return tool_error("items must be a JSON array of objects")
+
+    payload = [
+        {
+            "topicId": item.get("topic_id"),
+            "title": item.get("title"),
+            "url": item.get("url"),
+            "type": item.get("type")
+        }
+        for item in items_list
+    ]
+    try:
+        # Writes of many items or a whole lesson get a longer read budget
+        return app_post(f"{app_url}/api/letta", {"action": "add_resources_bulk", "items": payload}, timeout=(3, 30))
+    except ToolError as e:
+        return tool_error(*e.args)
+
+
+def add_code_examples_bulk(items: str) -> str:
+    """
+    Add several code examples in one call. Prefer this over repeated add_code_example
+    calls: collect all the examples you want to add, then call this once at the end.
+
+    Args:
+        items: JSON array of examples, each with topic_id, title, language
+            (one of 'gdscript', 'python', 'typescript', 'cpp'), code, and explanation
+
+    Returns:
+        str: JSON summary of how many examples were added and any per-item errors
+    """
+    import os
+
+    app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
+    try:
+        items_list = json_loads(items) if isinstance(items, str) else items
+    except ValueError as e:
+        return tool_error(f"items must be a JSON array: {e}")
+    if not isinstance(items_list, list) or not all(isinstance(item, dict) for item in items_list):
+        return tool_error("items must be a JSON array of objects")
+
+    payload = [
+        {
+            "topicId": item.get("topic_id"),
+            "title": item.get("title"),
+            "language": item.get("language"),
+            "code": item.get("code"),
+            "explanation": item.get("explanation")
+        }
+        for item in items_list
+    ]
+    try:
+        return app_post(f"{app_url}/api/letta", {"action": "add_code_examples_bulk", "items": payload}, timeout=(3, 30))
+    except ToolError as e:
+        return tool_error(*e.args)
 
 
 def add_lesson(
@@ -260,37 +431,39 @@ def add_lesson(
         str: JSON confirmation of the added lesson
     """
     import os
-    import json
-    import requests
 
     app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
     try:
-        # Parse JSON arrays
-        concepts_list = json.loads(concepts) if isinstance(concepts, str) else concepts
-        exercises_list = json.loads(exercises) if isinstance(exercises, str) else exercises
-        connections_list = json.loads(connections) if isinstance(connections, str) else connections
-
-        response = requests.post(
-            f"{app_url}/api/letta/lessons",
-            json={
-                "topicId": topic_id,
-                "title": title,
-                "difficulty": difficulty,
-                "content": {
-                    "introduction": introduction,
-                    "concepts": concepts_list,
-                    "explanation": explanation,
-                    "exercises": exercises_list,
-                    "connections": connections_list
-                },
-                "generatedFor": generated_for
-            }
-        )
-        if response.ok:
-            return json.dumps(response.json(), indent=2)
-        return f"Error: {response.status_code} - {response.text}"
-    except Exception as e:
-        return f"Error: {e}"
+        # Parse JSON arrays, rejecting anything else before the round-trip to the app
+        parsed = [
+            json_loads(value) if isinstance(value, str) else value
+            for value in (concepts, exercises, connections)
+        ]
+        if not all(isinstance(value, list) for value in parsed):
+            raise ValueError("got a non-array value")
+    except ValueError as e:
+        return tool_error(f"concepts, exercises, and connections must be JSON arrays: {e}")
+    concepts_list, exercises_list, connections_list = parsed
+
+    try:
+        result = app_post(f"{app_url}/api/letta/lessons", {
+            "topicId": topic_id,
+            "title": title,
+            "difficulty": difficulty,
+            "content": {
+                "introduction": introduction,
+                "concepts": concepts_list,
+                "explanation": explanation,
+                "exercises": exercises_list,
+                "connections": connections_list
+            },
+            "generatedFor": generated_for
+        }, timeout=(3, 30))
+    except ToolError as e:
+        return tool_error(*e.args)
+    # Drop get_lessons' cached entries so the new lesson shows up
+    clear_cache("lessons")
+    return result
 
 
 def get_lessons(topic_id: str = "") -> str:
@@ -304,20 +477,139 @@ def get_lessons(topic_id: str = "") -> str:
         str: JSON string of lessons
     """
     import os
-    import json
-    import requests
+    from urllib.parse import quote
 
     app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
+    url = f"{app_url}/api/letta/lessons?format=columnar"
+    if topic_id:
+        url += f"&topicId={quote(topic_id, safe='')}"
     try:
-        url = f"{app_url}/api/letta/lessons"
-        if topic_id:
-            url += f"?topicId={topic_id}"
-        response = requests.get(url)
-        if response.ok:
-            return json.dumps(response.json(), indent=2)
-        return f"Error: {response.status_code}"
-    except Exception as e:
-        return f"Error connecting to learning app at {app_url}: {e}"
+        return cached_get("lessons", url)
+    except ToolError as e:
+        return tool_error(*e.args)
+
+
+def compress_memory(summary: str) -> str:
+    """
+    Replace the learning_progress memory block with a compact summary when it is nearly full.
+    Write the summary yourself: keep the student's key struggles, strengths, and next steps,
+    and drop details that are no longer useful. Nothing is written unless the block is
+    over 80% of its limit, so it is safe to call after every curation session.
+
+    Args:
+        summary: The compressed learning_progress text to store
+
+    Returns:
+        str: JSON describing whether the block was compressed and its size before/after
+    """
+    import os
+
+    app_url = os.getenv("LEARNING_APP_URL", "http://localhost:5173")
+    try:
+        blocks = json_loads(app_get(f"{app_url}/api/letta/memory")).get("memoryBlocks", [])
+        block = next((b for b in blocks if b["label"] == "learning_progress"), None)
+        if not block:
+            return tool_error("learning_progress block not found")
+
+        used = len(block["value"])
+        limit = block.get("limit") or 4000
+        if used < 0.8 * limit:
+            return json_text({"compressed": False, "used": used, "limit": limit})
+
+        app_post(f"{app_url}/api/letta/memory", {"blockLabel": "learning_progress", "value": summary})
+        return json_text({"compressed": True, "before": used, "after": len(summary), "limit": limit})
+    except ToolError as e:
+        return tool_error(*e.args)
+    except ValueError as e:
+        return tool_error(f"Learning app returned invalid JSON: {e}")
+
+
+def upsert_memory(topic_id: str, note: str) -> str:
+    """
+    Save an observation about the student to long-term memory (a local SQLite store).
+    Use this for details - specific struggles, questions, breakthroughs - instead of
+    growing the learning_progress block. Saving the same note twice is a no-op.
+
+    Args:
+        topic_id: The topic the note is about (e.g., 'signals'), or 'general'
+        note: The observation to remember
+
+    Returns:
+        str: JSON confirmation of whether the note was saved
+    """
+    import os
+    import time
+    import sqlite3
+
+    db_path = os.path.expanduser("~/.cache/letta_agent_memory.db")
+    try:
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with sqlite3.connect(db_path) as db:
+            try:
+                db.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS memories "
+                    "USING fts5(topic_id, note, created_at UNINDEXED)"
+                )
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5 - fall back to a plain table searched with LIKE
+                db.execute("CREATE TABLE IF NOT EXISTS memories (topic_id TEXT, note TEXT, created_at TEXT)")
+            exists = db.execute(
+                "SELECT 1 FROM memories WHERE topic_id = ? AND note = ?", (topic_id, note)
+            ).fetchone()
+            if not exists:
+                db.execute(
+                    "INSERT INTO memories (topic_id, note, created_at) VALUES (?, ?, ?)",
+                    (topic_id, note, time.strftime("%Y-%m-%dT%H:%M:%S"))
+                )
+        return json_text({"saved": not exists, "topicId": topic_id})
+    except sqlite3.Error as e:
+        return tool_error(f"Could not save memory: {e}")
+
+
+def search_memory(query: str, limit: int = 5) -> str:
+    """
+    Search long-term memory for past observations about the student.
+    Use this to recall specifics on demand (e.g., "what does Mark struggle with in signals")
+    rather than keeping everything in the learning_progress block.
+
+    Args:
+        query: Words to search for
+        limit: Maximum number of notes to return (default 5)
+
+    Returns:
+        str: JSON array of matching notes with topic_id, note, and created_at
+    """
+    import os
+    import re
+    import sqlite3
+
+    db_path = os.path.expanduser("~/.cache/letta_agent_memory.db")
+    words = re.findall(r"\w+", query)
+    if not words or not os.path.exists(db_path):
+        return "[]"
+    try:
+        with sqlite3.connect(db_path) as db:
+            schema = db.execute("SELECT sql FROM sqlite_master WHERE name = 'memories'").fetchone()
+            if not schema:
+                return "[]"
+            if "fts5" in schema[0].lower():
+                rows = db.execute(
+                    "SELECT topic_id, note, created_at FROM memories WHERE memories MATCH ? "
+                    "ORDER BY rank LIMIT ?",
+                    (" OR ".join(f'"{word}"' for word in words), limit)
+                ).fetchall()
+            else:
+                clause = " OR ".join("note LIKE ?" for _ in words)
+                rows = db.execute(
+                    f"SELECT topic_id, note, created_at FROM memories WHERE {clause} "
+                    "ORDER BY created_at DESC LIMIT ?",
+                    [f"%{word}%" for word in words] + [limit]
+                ).fetchall()
+        return json_text(
+            [{"topic_id": t, "note": n, "created_at": c} for t, n, c in rows]
+        )
+    except sqlite3.Error as e:
+        return tool_error(f"Could not search memory: {e}")
 
 
 # All tools list for easy importing
@@ -328,8 +620,40 @@ ALL_TOOLS = [
     get_current_extensions,
     get_student_progress,
     get_student_notes,
+    get_student_notes_bulk,
+    get_curation_snapshot,
+    fetch_context_bundle,
     add_resource,
     add_code_example,
+    add_resources_bulk,
+    add_code_examples_bulk,
     add_lesson,
     get_lessons,
+    compress_memory,
+    upsert_memory,
+    search_memory,
+]
+
+# Tools that only read from the learning app and can safely run concurrently
+READ_ONLY_TOOLS = [
+    get_topics,
+    get_recent_conversations,
+    get_conversation_details,
+    get_current_extensions,
+    get_student_progress,
+    get_student_notes,
+    get_student_notes_bulk,
+    get_curation_snapshot,
+    fetch_context_bundle,
+    get_lessons,
+    search_memory,
+]
+
+# Individual reads that get_curation_snapshot covers in one request; the
+# Curator is registered with the snapshot instead of these
+SNAPSHOT_TOOLS = [
+    get_topics,
+    get_recent_conversations,
+    get_current_extensions,
+    get_student_progress,
 ]
@@ -0,0 +1,81 @@
+import { brotliCompress, constants, gzip } from 'zlib';
+import { promisify } from 'util';
+import type { Handle } from '@sveltejs/kit';
+
+const brotliCompressAsync = promisify(brotliCompress);
+const gzipAsync = promisify(gzip);
+
+// Only bother compressing payloads large enough to benefit
+const MIN_COMPRESS_BYTES = 1024;
+// Brotli's default quality (11) is tuned for static assets - 5 keeps per-request CPU low
+const BROTLI_QUALITY = 5;
+
+/**
+ * Pick br or gzip from an Accept-Encoding header, honouring q-values:
+ * q=0 rules a coding out, the higher q wins and ties go to br.
+ * `*` stands for any coding the header doesn't name.
+ */
+function pickEncoding(acceptEncoding: string): 'br' | 'gzip' | null {
+	const weights = new Map<string, number>();
+	for (const part of acceptEncoding.toLowerCase().split(',')) {
+		const [coding, ...params] = part.split(';').map(p => p.trim());
+		if (!coding) continue;
+		const q = params.find(p => p.startsWith('q='));
+		const weight = q ? Number(q.slice(2)) : 1;
+		weights.set(coding, Number.isNaN(weight) ? 0 : weight);
+	}
+	const weightOf = (coding: string) => weights.get(coding) ?? weights.get('*') ?? 0;
+	const br = weightOf('br');
+	const gz = weightOf('gzip');
+	if (br > 0 && br >= gz) return 'br';
+	return gz > 0 ? 'gzip' : null;
+}
+
+/**
+ * Compress JSON responses from the agent-facing API (/api/letta and /api/progress).
+ * Letta tools fetch conversation histories and extension listings from these
+ * routes, which can get large. Brotli is used when the client prefers it,
+ * gzip otherwise. Streaming routes are left untouched.
+ */
+export const handle: Handle = async ({ event, resolve }) => {
+	const response = await resolve(event);
+
+	const { pathname } = event.url;
+	if (!pathname.startsWith('/api/letta') && pathname !== '/api/progress') {
+		return response;
+	}
+	if (
+		!response.body ||
+		response.headers.has('content-encoding') ||
+		!response.headers.get('content-type')?.includes('application/json')
+	) {
+		return response;
+	}
+
+	// The body depends on Accept-Encoding from here on, even when it ends up
+	// uncompressed, so shared caches must key on it
+	const headers = new Headers(response.headers);
+	headers.append('Vary', 'Accept-Encoding');
+
+	const encoding = pickEncoding(event.request.headers.get('accept-encoding') ?? '');
+	const body = Buffer.from(await response.arrayBuffer());
+	if (!encoding || body.length < MIN_COMPRESS_BYTES) {
+		return new Response(body, { status: response.status, headers });
+	}
+
+	// Async so a large payload doesn't block other requests while it compresses
+	const compressed =
+		encoding === 'br'
+			? await brotliCompressAsync(body, { params: { [constants.BROTLI_PARAM_QUALITY]: BROTLI_QUALITY } })
+			: await gzipAsync(body);
+
+	headers.set('Content-Encoding', encoding);
+	headers.delete('Content-Length');
+	// A strong ETag promises byte-identical bodies, which no longer holds across
+	// encodings; the weak form still lets If-None-Match revalidate
+	const etag = headers.get('etag');
+	if (etag && !etag.startsWith('W/')) {
+		headers.set('ETag', `W/${etag}`);
+	}
+	return new Response(compressed, { status: response.status, headers });
+};
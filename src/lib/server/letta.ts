@@ -38,6 +38,7 @@ export interface AgentIds {
 	curator?: string;
 	sleeptime?: string;
 	shared_blocks?: {
+		human?: string;
 		learning_progress?: string;
 		curated_content?: string;
 	};
@@ -144,3 +145,33 @@ export function triggerBackgroundCuration(topicId: string, trigger: string = 'to
 			console.error(`Background curation trigger failed for topic ${topicId}:`, error.message);
 		});
 }
+
+function isPlainObject(value: unknown): value is Record<string, unknown> {
+	return typeof value === 'object' && value !== null && !Array.isArray(value);
+}
+
+/**
+ * Rewrite arrays of same-shaped objects as { columns, rows } so key names are
+ * sent once instead of once per row. Used for agent-facing responses
+ * (?format=columnar), where repeated keys would otherwise cost LLM tokens.
+ * Applied recursively; arrays with mixed shapes are left as-is.
+ */
+export function toColumnar(value: unknown): unknown {
+	if (Array.isArray(value)) {
+		const items = value.map(toColumnar);
+		if (items.length > 1 && items.every(isPlainObject)) {
+			const columns = Object.keys(items[0]);
+			const sameShape = items.every(
+				(item) => Object.keys(item).length === columns.length && columns.every((c) => c in item)
+			);
+			if (sameShape) {
+				return { columns, rows: items.map((item) => columns.map((c) => item[c])) };
+			}
+		}
+		return items;
+	}
+	if (isPlainObject(value)) {
+		return Object.fromEntries(Object.entries(value).map(([key, v]) => [key, toColumnar(v)]));
+	}
+	return value;
+}
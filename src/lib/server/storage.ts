@@ -296,6 +296,34 @@ export function addCodeExampleToTopic(
 	return extension;
 }
 
+export function addResourcesToTopic(
+	topicId: string,
+	resources: Array<{ title: string; url: string; type: 'docs' | 'source' | 'book' | 'video' }>,
+	addedBy: 'ai' | 'user' = 'ai'
+): TopicExtension {
+	const extension = getTopicExtension(topicId);
+	const addedAt = new Date().toISOString();
+	for (const resource of resources) {
+		extension.resources.push({ ...resource, addedAt, addedBy });
+	}
+	saveTopicExtension(extension);
+	return extension;
+}
+
+export function addCodeExamplesToTopic(
+	topicId: string,
+	examples: Array<{ title: string; language: 'gdscript' | 'typescript' | 'python' | 'cpp'; code: string; explanation: string }>,
+	addedBy: 'ai' | 'user' = 'ai'
+): TopicExtension {
+	const extension = getTopicExtension(topicId);
+	const addedAt = new Date().toISOString();
+	for (const example of examples) {
+		extension.codeExamples.push({ ...example, addedAt, addedBy });
+	}
+	saveTopicExtension(extension);
+	return extension;
+}
+
 export function getAllTopicExtensions(): Record<string, TopicExtension> {
 	ensureDataDirs();
 	if (!existsSync(EXTENSIONS_DIR)) {
@@ -1,53 +1,195 @@
 import { json } from '@sveltejs/kit';
+import { createHash } from 'crypto';
 import {
 	addResourceToTopic,
 	addCodeExampleToTopic,
+	addResourcesToTopic,
+	addCodeExamplesToTopic,
 	getTopicExtension,
 	getAllTopicExtensions,
 	listNotebooks,
-	getNotebook
+	getNotebook,
+	getProgress
 } from '$lib/server/storage';
 import { topics } from '$lib/data/topics';
+import { toColumnar } from '$lib/server/letta';
 import type { RequestHandler } from './$types';
 
+type BulkItem = Record<string, string>;
+
+const RESOURCE_TYPES = ['docs', 'source', 'book', 'video'];
+const CODE_LANGUAGES = ['gdscript', 'typescript', 'python', 'cpp'];
+
+// Required fields and allowed enum values for each kind of added content,
+// shared by the single-item and bulk actions
+const RESOURCE_RULES = { required: ['title', 'url', 'type'], enums: { type: RESOURCE_TYPES } };
+const CODE_EXAMPLE_RULES = {
+	required: ['title', 'language', 'code', 'explanation'],
+	enums: { language: CODE_LANGUAGES }
+};
+
+type ItemRules = { required: string[]; enums: Record<string, string[]> };
+
+/**
+ * Check one item against its rules. Returns the item's topic when it can be
+ * stored, otherwise the error and HTTP status for the first problem found.
+ */
+function validateItem(
+	item: BulkItem,
+	rules: ItemRules
+): { topic: (typeof topics)[number] } | { error: string; status: number } {
+	if (typeof item !== 'object' || item === null || Array.isArray(item)) {
+		return { error: 'Item must be an object', status: 400 };
+	}
+	const missing = ['topicId', ...rules.required].filter(f => !item[f]);
+	if (missing.length > 0) {
+		return { error: `Missing required fields: ${missing.join(', ')}`, status: 400 };
+	}
+	for (const [field, allowed] of Object.entries(rules.enums)) {
+		if (!allowed.includes(item[field])) {
+			return { error: `${field} must be one of: ${allowed.join(', ')}`, status: 400 };
+		}
+	}
+	const topic = topics.find(t => t.id === item.topicId);
+	if (!topic) {
+		return { error: `Topic '${item.topicId}' not found`, status: 404 };
+	}
+	return { topic };
+}
+
+/**
+ * Validate bulk items and group the valid ones by topic so each topic's
+ * extension file is written once. Invalid items are reported, not fatal.
+ */
+function groupBulkItems(items: BulkItem[], rules: ItemRules) {
+	const byTopic = new Map<string, BulkItem[]>();
+	const errors: Array<{ index: number; error: string }> = [];
+
+	items.forEach((item, index) => {
+		const result = validateItem(item, rules);
+		if ('error' in result) {
+			errors.push({ index, error: result.error });
+			return;
+		}
+		const group = byTopic.get(item.topicId) ?? [];
+		group.push(item);
+		byTopic.set(item.topicId, group);
+	});
+
+	return { byTopic, errors };
+}
+
+/**
+ * Respond with JSON plus a content hash ETag, or an empty 304 when the
+ * client's If-None-Match already matches (lets tools skip unchanged payloads).
+ * Matching is weak: the compression hook sends W/"..." for compressed bodies,
+ * and clients echo back whichever form they were given.
+ */
+function jsonWithETag(request: Request, data: unknown): Response {
+	const body = JSON.stringify(data);
+	const etag = `"${createHash('sha1').update(body).digest('hex')}"`;
+	const match = (request.headers.get('if-none-match') ?? '')
+		.split(',')
+		.map(tag => tag.trim())
+		.find(tag => tag.replace(/^W\//, '') === etag);
+	if (match) {
+		return new Response(null, { status: 304, headers: { ETag: match } });
+	}
+	return new Response(body, {
+		headers: { 'Content-Type': 'application/json', ETag: etag }
+	});
+}
+
+// Topic metadata for Letta to understand the curriculum
+function getTopicSummaries() {
+	return topics.map(t => ({
+		id: t.id,
+		title: t.title,
+		category: t.category,
+		description: t.description,
+		keyPoints: t.keyPoints,
+		exerciseCount: t.exercises.length,
+		resourceCount: t.resources.length,
+		codeExampleCount: t.codeExamples.length
+	}));
+}
+
+// The snapshot is a whole-curriculum overview that has to fit in an agent's
+// context next to its prompt, so it only carries each notebook's latest
+// messages, clipped, and extension titles without code bodies.
+// fetch_context_bundle returns the full detail for the topics an agent picks
+const SNAPSHOT_MESSAGES = 6;
+const SNAPSHOT_TEXT_CHARS = 400;
+
+function clip(text: string): string {
+	if (text.length <= SNAPSHOT_TEXT_CHARS) return text;
+	return `${text.slice(0, SNAPSHOT_TEXT_CHARS)}… [${text.length - SNAPSHOT_TEXT_CHARS} more chars truncated]`;
+}
+
+function getSnapshot() {
+	const progress = getProgress();
+	return {
+		topics: getTopicSummaries(),
+		notebooks: listNotebooks().map(n => {
+			const recent = n.messageCount > 0 ? getNotebook(n.topicId).messages.slice(-SNAPSHOT_MESSAGES) : [];
+			return {
+				...n,
+				omittedMessages: n.messageCount - recent.length,
+				messages: recent.map(m => ({ ...m, content: clip(m.content) }))
+			};
+		}),
+		// Titles and URLs are enough to avoid adding duplicates
+		extensions: Object.fromEntries(
+			Object.entries(getAllTopicExtensions()).map(([topicId, ext]) => [
+				topicId,
+				{
+					topicId,
+					resources: ext.resources.map(r => ({ title: r.title, url: r.url, type: r.type })),
+					codeExamples: ext.codeExamples.map(c => ({ title: c.title, language: c.language }))
+				}
+			])
+		),
+		progress: {
+			topics: Object.fromEntries(
+				Object.entries(progress.topics).map(([topicId, p]) => [topicId, { ...p, notes: clip(p.notes ?? '') }])
+			)
+		}
+	};
+}
+
 // GET - Letta can fetch current state
-export const GET: RequestHandler = async ({ url }) => {
+export const GET: RequestHandler = async ({ url, request }) => {
 	const action = url.searchParams.get('action');
+	// Agent tools ask for columnar arrays to avoid repeating keys per row
+	const shape = (data: unknown) => (url.searchParams.get('format') === 'columnar' ? toColumnar(data) : data);
 
 	switch (action) {
 		case 'topics':
 			// Return all topic metadata for Letta to understand the curriculum
-			return json({
-				topics: topics.map(t => ({
-					id: t.id,
-					title: t.title,
-					category: t.category,
-					description: t.description,
-					keyPoints: t.keyPoints,
-					exerciseCount: t.exercises.length,
-					resourceCount: t.resources.length,
-					codeExampleCount: t.codeExamples.length
-				}))
-			});
+			return json(shape({ topics: getTopicSummaries() }));
 
 		case 'extensions':
 			// Return all dynamically added content
-			return json({ extensions: getAllTopicExtensions() });
+			return jsonWithETag(request, shape({ extensions: getAllTopicExtensions() }));
 
 		case 'notebooks':
 			// Return notebook summaries for Letta to analyze
-			return json({ notebooks: listNotebooks() });
+			return json(shape({ notebooks: listNotebooks() }));
 
 		case 'notebook':
 			const topicId = url.searchParams.get('topicId');
 			if (!topicId) {
 				return json({ error: 'topicId required' }, { status: 400 });
 			}
-			return json({ notebook: getNotebook(topicId) });
+			return json(shape({ notebook: getNotebook(topicId) }));
+
+		case 'snapshot':
+			// A bounded overview of everything the Curator needs in one round-trip
+			return json(shape(getSnapshot()));
 
 		default:
 			return json({
-				available_actions: ['topics', 'extensions', 'notebooks', 'notebook'],
+				available_actions: ['topics', 'extensions', 'notebooks', 'notebook', 'snapshot'],
 				description: 'Letta integration API for the Godot Learning App'
 			});
 	}
@@ -61,14 +203,11 @@ export const POST: RequestHandler = async ({ request }) => {
 	switch (action) {
 		case 'add_resource': {
 			const { topicId, title, url, type } = body;
-			if (!topicId || !title || !url || !type) {
-				return json({ error: 'Missing required fields: topicId, title, url, type' }, { status: 400 });
-			}
-			// Validate topic exists
-			const topic = topics.find(t => t.id === topicId);
-			if (!topic) {
-				return json({ error: `Topic '${topicId}' not found` }, { status: 404 });
+			const result = validateItem(body, RESOURCE_RULES);
+			if ('error' in result) {
+				return json({ error: result.error }, { status: result.status });
 			}
+			const { topic } = result;
 			const extension = addResourceToTopic(topicId, { title, url, type }, 'ai');
 			return json({
 				success: true,
@@ -79,13 +218,11 @@ export const POST: RequestHandler = async ({ request }) => {
 
 		case 'add_code_example': {
 			const { topicId, title, language, code, explanation } = body;
-			if (!topicId || !title || !language || !code || !explanation) {
-				return json({ error: 'Missing required fields: topicId, title, language, code, explanation' }, { status: 400 });
-			}
-			const topic = topics.find(t => t.id === topicId);
-			if (!topic) {
-				return json({ error: `Topic '${topicId}' not found` }, { status: 404 });
+			const result = validateItem(body, CODE_EXAMPLE_RULES);
+			if ('error' in result) {
+				return json({ error: result.error }, { status: result.status });
 			}
+			const { topic } = result;
 			const extension = addCodeExampleToTopic(topicId, { title, language, code, explanation }, 'ai');
 			return json({
 				success: true,
@@ -94,10 +231,61 @@ export const POST: RequestHandler = async ({ request }) => {
 			});
 		}
 
+		case 'add_resources_bulk': {
+			const { items } = body;
+			if (!Array.isArray(items) || items.length === 0) {
+				return json({ error: 'items must be a non-empty array' }, { status: 400 });
+			}
+			const { byTopic, errors } = groupBulkItems(items, RESOURCE_RULES);
+			let added = 0;
+			for (const [topicId, group] of byTopic) {
+				addResourcesToTopic(
+					topicId,
+					group.map(({ title, url, type }) => ({ title, url, type: type as 'docs' | 'source' | 'book' | 'video' })),
+					'ai'
+				);
+				added += group.length;
+			}
+			return json({
+				success: added > 0,
+				message: `Added ${added} of ${items.length} resources`,
+				added,
+				errors
+			}, { status: added > 0 ? 200 : 400 });
+		}
+
+		case 'add_code_examples_bulk': {
+			const { items } = body;
+			if (!Array.isArray(items) || items.length === 0) {
+				return json({ error: 'items must be a non-empty array' }, { status: 400 });
+			}
+			const { byTopic, errors } = groupBulkItems(items, CODE_EXAMPLE_RULES);
+			let added = 0;
+			for (const [topicId, group] of byTopic) {
+				addCodeExamplesToTopic(
+					topicId,
+					group.map(({ title, language, code, explanation }) => ({
+						title,
+						language: language as 'gdscript' | 'typescript' | 'python' | 'cpp',
+						code,
+						explanation
+					})),
+					'ai'
+				);
+				added += group.length;
+			}
+			return json({
+				success: added > 0,
+				message: `Added ${added} of ${items.length} code examples`,
+				added,
+				errors
+			}, { status: added > 0 ? 200 : 400 });
+		}
+
 		default:
 			return json({
 				error: 'Unknown action',
-				available_actions: ['add_resource', 'add_code_example']
+				available_actions: ['add_resource', 'add_code_example', 'add_resources_bulk', 'add_code_examples_bulk']
 			}, { status: 400 });
 	}
 };
@@ -81,8 +81,7 @@ You are now in CONTENT GENERATION mode for topic: ${topicId}${typeHint}
 Your task is to CREATE NEW LEARNING MATERIALS. Follow these steps:
 
 1. RESEARCH PHASE:
-   - Use get_current_extensions('${topicId}') to see what already exists
-   - Use get_conversation_details('${topicId}') to understand what the student struggled with
+   - Use fetch_context_bundle('["${topicId}"]') to see what already exists and what the student struggled with
    - Use web_search to find HIGH-QUALITY resources about this topic
    - Search for: official Godot docs, GDQuest tutorials, game dev best practices
 
@@ -120,10 +119,9 @@ Do not just analyze - actually CREATE content now.
 		curatePrompt = `
 Please curate content specifically for the topic: ${topicId}
 
-1. Use get_conversation_details('${topicId}') to see what the student asked about this topic
-2. Use get_student_notes('${topicId}') to see their personal notes
-3. Use get_current_extensions('${topicId}') to check what's already been added
-4. Based on the conversation and notes:
+1. Use fetch_context_bundle('["${topicId}"]') to see what the student asked about this topic,
+   their personal notes, and what's already been added
+2. Based on the conversation and notes:
    - Identify specific questions or confusion points
    - Find 1-2 highly relevant resources using web_search
    - Create a code example if it would help clarify a concept
@@ -135,9 +133,7 @@ ACTION: Actually add the content using add_resource, add_code_example, or add_le
 		curatePrompt = `
 Please analyze the student's overall learning progress:
 
-1. Use get_student_progress to see completion status across all topics
-2. Use get_recent_conversations to see activity patterns
-3. Use get_topics to understand the curriculum structure
+1. Use get_curation_snapshot to see completion status, activity patterns, and the curriculum structure
 
 Provide insights on:
 - Which topics has the student spent the most time on?
@@ -152,10 +148,9 @@ Update your memory with these insights for future curation.
 		curatePrompt = `
 You are in ENRICHMENT mode. Your goal is to add valuable content to topics that need it.
 
-1. Use get_topics to see all available topics
-2. For each topic, use get_current_extensions to check existing content
-3. For topics with FEW resources (< 3), use web_search to find good materials
-4. ADD at least one resource or code example to topics that need it
+1. Use get_curation_snapshot to see all available topics and their existing content
+2. For topics with FEW resources (< 3), use web_search to find good materials
+3. ADD at least one resource or code example to topics that need it
 
 Priority order for resources:
 1. Official Godot documentation (docs.godotengine.org)
@@ -171,11 +166,10 @@ Target: Add content to at least 3 different topics.
 		curatePrompt = `
 Please perform a comprehensive curation session:
 
-1. Use get_recent_conversations to see which topics have recent activity
-2. For active topics, use get_conversation_details to understand what the student asked
-3. Use get_student_progress to see overall learning status
-4. Use get_current_extensions to see what has already been added
-5. Based on your analysis:
+1. Use get_curation_snapshot to see recent activity (the latest messages per topic),
+   overall learning status, and what has already been added; call fetch_context_bundle
+   for the full conversations of the topics you focus on
+2. Based on your analysis:
    - Identify knowledge gaps or confusion points
    - Search for 2-3 high-quality resources to address these gaps
    - Add resources using add_resource
@@ -8,12 +8,15 @@ import {
 	logAgentActivity
 } from '$lib/server/storage';
 import { topics } from '$lib/data/topics';
+import { toColumnar } from '$lib/server/letta';
 import type { RequestHandler } from './$types';
 
 // GET - Retrieve lessons
 export const GET: RequestHandler = async ({ url }) => {
 	const topicId = url.searchParams.get('topicId');
 	const lessonId = url.searchParams.get('lessonId');
+	// ?format=columnar is used by the get_lessons tool (see toColumnar)
+	const shape = (data: unknown) => (url.searchParams.get('format') === 'columnar' ? toColumnar(data) : data);
 
 	// Get a specific lesson
 	if (topicId && lessonId) {
@@ -27,17 +30,17 @@ export const GET: RequestHandler = async ({ url }) => {
 	// Get all lessons for a topic
 	if (topicId) {
 		const lessons = getLessonsForTopic(topicId);
-		return json({ topicId, lessons, count: lessons.length });
+		return json(shape({ topicId, lessons, count: lessons.length }));
 	}
 
 	// Get all lessons across all topics
 	const allLessons = getAllLessons();
 	const totalCount = Object.values(allLessons).reduce((sum, arr) => sum + arr.length, 0);
-	return json({
+	return json(shape({
 		lessons: allLessons,
 		totalCount,
 		topicCount: Object.keys(allLessons).length
-	});
+	}));
 };
 
 // POST - Create a new lesson
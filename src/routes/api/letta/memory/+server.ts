@@ -48,7 +48,7 @@ export const GET: RequestHandler = async ({ url }) => {
 					label: block.label,
 					value: block.value || '',
 					limit: block.limit,
-					isShared: ['learning_progress', 'curated_content'].includes(block.label)
+					isShared: ['human', 'learning_progress', 'curated_content'].includes(block.label)
 				});
 			}
 		}
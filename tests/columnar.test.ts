@@ -0,0 +1,86 @@
+import { describe, it, expect } from 'vitest';
+import { toColumnar } from '$lib/server/letta';
+
+type Columnar = { columns: string[]; rows: unknown[][] };
+
+// Rebuild the original objects from a columnar table
+function fromColumnar({ columns, rows }: Columnar) {
+	return rows.map(row => Object.fromEntries(columns.map((column, i) => [column, row[i]])));
+}
+
+describe('toColumnar', () => {
+	it('should leave an empty list unchanged', () => {
+		expect(toColumnar([])).toEqual([]);
+		expect(toColumnar({ topics: [] })).toEqual({ topics: [] });
+	});
+
+	it('should leave a single-item list unchanged', () => {
+		expect(toColumnar([{ id: 'a' }])).toEqual([{ id: 'a' }]);
+	});
+
+	it('should convert same-shaped objects to columns and rows', () => {
+		const topics = [
+			{ id: 'nodes', title: 'Nodes' },
+			{ id: 'signals', title: 'Signals' }
+		];
+		expect(toColumnar({ topics })).toEqual({
+			topics: { columns: ['id', 'title'], rows: [['nodes', 'Nodes'], ['signals', 'Signals']] }
+		});
+	});
+
+	it('should accept the same keys in a different order', () => {
+		const result = toColumnar([
+			{ id: 'a', count: 1 },
+			{ count: 2, id: 'b' }
+		]) as Columnar;
+		expect(result.columns).toEqual(['id', 'count']);
+		expect(result.rows).toEqual([['a', 1], ['b', 2]]);
+	});
+
+	it('should leave lists with mixed shapes as-is', () => {
+		const extraKey = [{ id: 'a' }, { id: 'b', title: 'B' }];
+		const missingKey = [{ id: 'a', title: 'A' }, { title: 'B' }];
+		const notObjects = [{ id: 'a' }, 'b', null];
+		expect(toColumnar(extraKey)).toEqual(extraKey);
+		expect(toColumnar(missingKey)).toEqual(missingKey);
+		expect(toColumnar(notObjects)).toEqual(notObjects);
+	});
+
+	it('should convert nested lists inside rows and objects', () => {
+		const notebooks = [
+			{ topicId: 'nodes', messages: [{ role: 'user', content: 'hi' }, { role: 'assistant', content: 'hello' }] },
+			{ topicId: 'signals', messages: [] }
+		];
+		const result = toColumnar({ notebooks }) as { notebooks: Columnar };
+		expect(result.notebooks.columns).toEqual(['topicId', 'messages']);
+		expect(result.notebooks.rows[0][1]).toEqual({
+			columns: ['role', 'content'],
+			rows: [['user', 'hi'], ['assistant', 'hello']]
+		});
+		expect(result.notebooks.rows[1][1]).toEqual([]);
+	});
+
+	it('should pass primitives and arrays of primitives through', () => {
+		expect(toColumnar('text')).toBe('text');
+		expect(toColumnar(3)).toBe(3);
+		expect(toColumnar(null)).toBeNull();
+		expect(toColumnar(['a', 'b'])).toEqual(['a', 'b']);
+	});
+
+	it('should round-trip rows back to the original objects', () => {
+		const topics = [
+			{ id: 'nodes', title: 'Nodes', keyPoints: ['tree', 'scenes'], exerciseCount: 3 },
+			{ id: 'signals', title: 'Signals', keyPoints: ['observer'], exerciseCount: 0 },
+			{ id: 'physics', title: 'Physics', keyPoints: [], exerciseCount: 5 }
+		];
+		const result = toColumnar(topics) as Columnar;
+		expect(fromColumnar(result)).toEqual(topics);
+	});
+
+	it('should not modify its input', () => {
+		const input = { topics: [{ id: 'a' }, { id: 'b' }] };
+		const copy = structuredClone(input);
+		toColumnar(input);
+		expect(input).toEqual(copy);
+	});
+});
@@ -0,0 +1,124 @@
+// @vitest-environment node
+import { describe, it, expect } from 'vitest';
+import { brotliDecompressSync, gunzipSync } from 'zlib';
+import type { RequestEvent } from '@sveltejs/kit';
+import { handle } from '../src/hooks.server';
+
+const LARGE_JSON = JSON.stringify({ items: Array.from({ length: 200 }, (_, i) => ({ id: i, title: `Item ${i}` })) });
+const SMALL_JSON = JSON.stringify({ ok: true });
+
+// Run the hook for a request to path, with resolve answering with response
+async function run(path: string, response: Response, acceptEncoding: string | null = 'gzip, deflate, br') {
+	const headers = new Headers();
+	if (acceptEncoding !== null) headers.set('accept-encoding', acceptEncoding);
+	const url = new URL(`http://localhost${path}`);
+	const event = { url, request: new Request(url, { headers }) } as unknown as RequestEvent;
+	return handle({ event, resolve: async () => response });
+}
+
+function jsonResponse(body: string, headers: Record<string, string> = {}) {
+	return new Response(body, { headers: { 'Content-Type': 'application/json', ...headers } });
+}
+
+async function bodyBytes(response: Response) {
+	return Buffer.from(await response.arrayBuffer());
+}
+
+describe('Compression hook', () => {
+	it('should prefer brotli when the client accepts it', async () => {
+		const response = await run('/api/letta?action=extensions', jsonResponse(LARGE_JSON));
+		expect(response.headers.get('content-encoding')).toBe('br');
+		expect(response.headers.get('vary')).toContain('Accept-Encoding');
+		expect(brotliDecompressSync(await bodyBytes(response)).toString()).toBe(LARGE_JSON);
+	});
+
+	it('should fall back to gzip without brotli', async () => {
+		const response = await run('/api/progress', jsonResponse(LARGE_JSON), 'gzip, deflate');
+		expect(response.headers.get('content-encoding')).toBe('gzip');
+		expect(gunzipSync(await bodyBytes(response)).toString()).toBe(LARGE_JSON);
+	});
+
+	it('should not mistake a token containing br for brotli', async () => {
+		const response = await run('/api/letta', jsonResponse(LARGE_JSON), 'gzip, xbrx');
+		expect(response.headers.get('content-encoding')).toBe('gzip');
+	});
+
+	it('should leave the body alone when the client accepts neither', async () => {
+		const response = await run('/api/letta', jsonResponse(LARGE_JSON), null);
+		expect(response.headers.get('content-encoding')).toBeNull();
+		expect(response.headers.get('vary')).toContain('Accept-Encoding');
+		expect(await response.text()).toBe(LARGE_JSON);
+	});
+
+	it('should skip codings refused with q=0', async () => {
+		const noBrotli = await run('/api/letta', jsonResponse(LARGE_JSON), 'br;q=0, gzip');
+		expect(noBrotli.headers.get('content-encoding')).toBe('gzip');
+
+		const neither = await run('/api/letta', jsonResponse(LARGE_JSON), 'gzip;q=0, *;q=0');
+		expect(neither.headers.get('content-encoding')).toBeNull();
+		expect(await neither.text()).toBe(LARGE_JSON);
+	});
+
+	it('should pick the coding with the higher q-value', async () => {
+		const response = await run('/api/letta', jsonResponse(LARGE_JSON), 'br;q=0.5, gzip;q=1');
+		expect(response.headers.get('content-encoding')).toBe('gzip');
+
+		const wildcard = await run('/api/letta', jsonResponse(LARGE_JSON), '*');
+		expect(wildcard.headers.get('content-encoding')).toBe('br');
+	});
+
+	it('should not compress bodies under 1KB', async () => {
+		const response = await run('/api/letta', jsonResponse(SMALL_JSON));
+		expect(response.headers.get('content-encoding')).toBeNull();
+		expect(response.headers.get('vary')).toContain('Accept-Encoding');
+		expect(await response.text()).toBe(SMALL_JSON);
+	});
+
+	it('should compress bodies at exactly 1KB', async () => {
+		const body = JSON.stringify({ pad: 'x'.repeat(1024 - 10) });
+		expect(Buffer.byteLength(body)).toBe(1024);
+		const response = await run('/api/letta', jsonResponse(body));
+		expect(response.headers.get('content-encoding')).toBe('br');
+	});
+
+	it('should only compress the agent-facing routes', async () => {
+		for (const path of ['/api/chat', '/api/progress/reset', '/topics/nodes']) {
+			const response = await run(path, jsonResponse(LARGE_JSON));
+			expect(response.headers.get('content-encoding')).toBeNull();
+			expect(await response.text()).toBe(LARGE_JSON);
+		}
+	});
+
+	it('should skip non-JSON and already-encoded responses', async () => {
+		const stream = await run('/api/letta', new Response(LARGE_JSON, { headers: { 'Content-Type': 'text/event-stream' } }));
+		expect(stream.headers.get('content-encoding')).toBeNull();
+
+		const encoded = await run('/api/letta', jsonResponse(LARGE_JSON, { 'Content-Encoding': 'identity' }));
+		expect(encoded.headers.get('content-encoding')).toBe('identity');
+		expect(await encoded.text()).toBe(LARGE_JSON);
+	});
+
+	it('should weaken the ETag of compressed responses and keep their status', async () => {
+		const response = await run('/api/letta?action=extensions', jsonResponse(LARGE_JSON, { ETag: '"abc123"' }));
+		expect(response.status).toBe(200);
+		expect(response.headers.get('etag')).toBe('W/"abc123"');
+		expect(response.headers.get('content-encoding')).toBe('br');
+
+		const weak = await run('/api/letta?action=extensions', jsonResponse(LARGE_JSON, { ETag: 'W/"abc123"' }));
+		expect(weak.headers.get('etag')).toBe('W/"abc123"');
+	});
+
+	it('should keep the strong ETag of uncompressed responses', async () => {
+		const response = await run('/api/letta?action=extensions', jsonResponse(LARGE_JSON, { ETag: '"abc123"' }), null);
+		expect(response.headers.get('etag')).toBe('"abc123"');
+	});
+
+	it('should pass 304 Not Modified through uncompressed', async () => {
+		const notModified = new Response(null, { status: 304, headers: { ETag: '"abc123"' } });
+		const response = await run('/api/letta?action=extensions', notModified);
+		expect(response.status).toBe(304);
+		expect(response.headers.get('etag')).toBe('"abc123"');
+		expect(response.headers.get('content-encoding')).toBeNull();
+		expect(response.body).toBeNull();
+	});
+});